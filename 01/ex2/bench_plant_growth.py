@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+
+from array import array
+from time import perf_counter
+
+from ft_plant_growth import Plant, grow_population
+
+
+def bench_plant(days, n) -> float:
+    '''
+        bench_plant() return the time in ns needed by Plant.grow() to grow
+        one plant by days days (average over n plants)
+    '''
+    plants = [Plant("Rose", 0, 1, 0.001, 10 ** 9) for _ in range(n)]
+    start = perf_counter()
+    for plant in plants:
+        plant.grow(days)
+    return ((perf_counter() - start) / n * 1e9)
+
+
+def bench_population(days, n) -> float:
+    '''
+        bench_population() return the time in ns per plant needed by
+        grow_population() to grow n plants by days days
+    '''
+    heights = array('d', [1] * n)
+    grow_speeds = array('d', [0.001] * n)
+    max_heights = array('d', [10 ** 9] * n)
+    start = perf_counter()
+    grow_population(heights, grow_speeds, max_heights, days)
+    return ((perf_counter() - start) / n * 1e9)
+
+
+def bench_plant_growth():
+    '''
+        bench_plant_growth() display the cost per plant of a growth for
+        an increasing number of days
+    '''
+    n = 100000
+    print(f"=== Growth benchmark ({n} plants) ===")
+    for days in (1, 7, 365, 3650, 36500):
+        plant = bench_plant(days, n)
+        population = bench_population(days, n)
+        print(f"{days:>6} days: Plant.grow {plant:8.1f} ns/plant,", end=' ')
+        print(f"grow_population {population:8.1f} ns/plant")
+
+
+if __name__ == "__main__":
+    bench_plant_growth()
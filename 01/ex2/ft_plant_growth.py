@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+from array import array
+
+
 class Plant:
     '''
         Plant class is a class that contains all the informations about a Plant
@@ -15,12 +18,12 @@ class Plant:
     def grow(self, days) -> None:
         '''
             grow() is a method that grow the plants by days * grow_speed cm
+            (the height cannot go over max_height)
         '''
-        for i in range(days):
-            self.height += self.grow_speed
-            if (self.height >= self.max_height):
-                self.height = self.max_height
-                return ()
+        if days <= 0:
+            return ()
+        self.height = min(self.height + days * self.grow_speed,
+                          self.max_height)
 
     def age(self, days) -> None:
         '''
@@ -44,6 +47,19 @@ class Plant:
         return (self.height - self.starting_height)
 
 
+def grow_population(heights, grow_speeds, max_heights, days) -> array:
+    '''
+        grow_population() is a function that grow a whole population of
+        plants stored in columns (array or list) by days * grow_speed cm,
+        each height being capped by its max_height. It returns the new
+        heights as an array of floats.
+    '''
+    if days <= 0:
+        return (array('d', heights))
+    columns = zip(heights, grow_speeds, max_heights)
+    return (array('d', [min(h + days * s, m) for h, s, m in columns]))
+
+
 def create_garden():
     '''
        create_garden() create the garden with one plant and age anf grow it
@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+from array import array
+
+
 class Plant:
     '''
         Plant class is a class that contains all the informations about a Plant
@@ -22,6 +25,115 @@ class Plant:
         print(f'{name}: {height}cm ,{age} day{(age > 0) * "s"} old')
 
 
+class PlantTable:
+    '''
+        PlantTable class is a columnar store of plants : every attribute is
+        kept in its own contiguous typed array instead of one Plant object
+        per plant
+    '''
+    def __init__(self) -> None:
+        self.names = []
+        self.ages = array('q')
+        self.heights = array('d')
+        self.grow_speeds = array('d')
+        self.max_heights = array('d')
+
+    def __len__(self) -> int:
+        return (len(self.names))
+
+    def __getitem__(self, index) -> 'PlantRow':
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("PlantTable index out of range")
+        return (PlantRow(self, index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield PlantRow(self, index)
+
+    def extend(self, plant_list) -> None:
+        '''
+            extend() is a method that add all the plants of a list of dict
+            to the table, column by column. The list is read once and every
+            column is converted before the table is changed, so a bad plant
+            leaves the table untouched
+        '''
+        plant_list = list(plant_list)
+        names = [plant["name"].capitalize() for plant in plant_list]
+        ages = array('q', [plant["age"] for plant in plant_list])
+        heights = array('d', [plant["height"] for plant in plant_list])
+        grow_speeds = array('d', [plant["grow_speed"]
+                                  for plant in plant_list])
+        max_heights = array('d', [plant["max_height"]
+                                  for plant in plant_list])
+        self.names.extend(names)
+        self.ages.extend(ages)
+        self.heights.extend(heights)
+        self.grow_speeds.extend(grow_speeds)
+        self.max_heights.extend(max_heights)
+
+
+class PlantRow:
+    '''
+        PlantRow class is a lightweight view over one row of a PlantTable
+    '''
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index) -> None:
+        self.table = table
+        self.index = index
+
+    @property
+    def name(self) -> str:
+        return (self.table.names[self.index])
+
+    @property
+    def days_old(self) -> int:
+        return (self.table.ages[self.index])
+
+    @property
+    def height(self) -> float:
+        return (self.table.heights[self.index])
+
+    @property
+    def grow_speed(self) -> float:
+        return (self.table.grow_speeds[self.index])
+
+    @property
+    def max_height(self) -> float:
+        return (self.table.max_heights[self.index])
+
+    def to_plant(self) -> Plant:
+        '''
+            to_plant() is a method that create the Plant of the row
+        '''
+        return (Plant(self.name, self.days_old, self.height,
+                      self.grow_speed, self.max_height))
+
+    def print_plant(self) -> None:
+        '''
+            print_plant() is a method that display informations about a plant
+        '''
+        name = self.name
+        age = self.days_old
+        height = self.height
+        if height.is_integer():
+            height = int(height)
+        print(f'{name}: {height}cm ,{age} day{(age > 0) * "s"} old')
+
+
+def ft_plant_table(plant_list) -> PlantTable:
+    '''
+        ft_plant_table() is a bulk version of ft_plant_factory(), it stores
+        the plants of the list of dict in a PlantTable without creating
+        one object per plant and without printing them.
+    '''
+    table = PlantTable()
+    table.extend(plant_list)
+    return (table)
+
+
 def ft_plant_factory(plant_list):
     '''
         ft_plant_factory() is a factory for the class Plant, it creates plants
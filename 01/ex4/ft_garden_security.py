@@ -1,5 +1,8 @@
 #!/usr/bin/env python3
 
+from array import array
+
+
 class SecurePlant:
     '''
         SecurePlant class is a class that contains all the informations about
@@ -67,6 +70,142 @@ class SecurePlant:
         print(f'{name}: {height}cm, {age} day{(age > 0) * "s"} old')
 
 
+class SecurePlantTable:
+    '''
+        SecurePlantTable class is a columnar store of plants : every
+        attribute is kept in its own contiguous typed array. The same
+        security rules than SecurePlant are applied on bulk loading
+        (negative age or height become 0, height is capped by max_height).
+    '''
+    def __init__(self) -> None:
+        self.names = []
+        self.__ages = array('q')
+        self.__heights = array('d')
+        self.grow_speeds = array('d')
+        self.max_heights = array('d')
+
+    def __len__(self) -> int:
+        return (len(self.names))
+
+    def __getitem__(self, index) -> 'SecurePlantRow':
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("SecurePlantTable index out of range")
+        return (SecurePlantRow(self, index))
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield SecurePlantRow(self, index)
+
+    def extend(self, plant_list) -> None:
+        '''
+            extend() is a method that add all the plants of a list of dict
+            to the table, column by column. The list is read once and every
+            column is converted before the table is changed, so a bad plant
+            leaves the table untouched
+        '''
+        plant_list = list(plant_list)
+        max_heights = array('d', [plant["max_height"]
+                                  for plant in plant_list])
+        names = [plant["name"].capitalize() for plant in plant_list]
+        ages = array('q', [max(plant["age"], 0) for plant in plant_list])
+        heights = array('d', [min(max(plant["height"], 0), max_height)
+                              for plant, max_height
+                              in zip(plant_list, max_heights)])
+        grow_speeds = array('d', [plant["grow_speed"]
+                                  for plant in plant_list])
+        self.names.extend(names)
+        self.__ages.extend(ages)
+        self.__heights.extend(heights)
+        self.grow_speeds.extend(grow_speeds)
+        self.max_heights.extend(max_heights)
+
+    def get_age(self, index) -> int:
+        '''
+            get_age() is a method that return the age of the plant at index
+        '''
+        return (self.__ages[index])
+
+    def set_age(self, index, age) -> bool:
+        '''
+            set_age() is a method that set the age of the plant at index with
+            security (age cannot be a negative value)
+        '''
+        if age >= 0:
+            self.__ages[index] = age
+            return True
+        return False
+
+    def get_height(self, index) -> float:
+        '''
+            get_height() is a method that return the height of the plant at
+            index
+        '''
+        return (self.__heights[index])
+
+    def set_height(self, index, height) -> bool:
+        '''
+            set_height() is a method that set the height of the plant at index
+            with security (height cannot be a negative value or greater than
+            the max height).
+        '''
+        if height >= 0:
+            self.__heights[index] = min(height, self.max_heights[index])
+            return True
+        return False
+
+
+class SecurePlantRow:
+    '''
+        SecurePlantRow class is a lightweight view over one row of a
+        SecurePlantTable
+    '''
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index) -> None:
+        self.table = table
+        self.index = index
+
+    @property
+    def name(self) -> str:
+        return (self.table.names[self.index])
+
+    def get_age(self) -> int:
+        return (self.table.get_age(self.index))
+
+    def set_age(self, age) -> bool:
+        return (self.table.set_age(self.index, age))
+
+    def get_height(self) -> float:
+        return (self.table.get_height(self.index))
+
+    def set_height(self, height) -> bool:
+        return (self.table.set_height(self.index, height))
+
+    def print_plant(self) -> None:
+        '''
+            print_plant() is a method that display informations about a plant
+        '''
+        name = self.name
+        age = self.get_age()
+        height = self.get_height()
+        if height.is_integer():
+            height = int(height)
+        print(f'{name}: {height}cm, {age} day{(age > 0) * "s"} old')
+
+
+def ft_plant_table(plant_list) -> SecurePlantTable:
+    '''
+        ft_plant_table() is a bulk version of ft_plant_factory(), it stores
+        the plants of the list of dict in a SecurePlantTable without
+        creating one object per plant and without printing them.
+    '''
+    table = SecurePlantTable()
+    table.extend(plant_list)
+    return (table)
+
+
 def ft_plant_factory(plant_list):
     '''
         ft_plant_factory() is a factory for the class Plant, it creates plants
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import tracemalloc
+from contextlib import redirect_stdout
+
+from ft_plant_types import SecurePlant, Flower, Tree, Vegetable
+from ft_compact_plant_types import CompactSecurePlant, CompactFlower, \
+    CompactTree, CompactVegetable
+
+
+def bytes_per_plant(cls, args, n) -> float:
+    '''
+        bytes_per_plant() return the memory traced by tracemalloc for one
+        instance of cls, averaged over n instances
+    '''
+    plants = [None] * n
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(n):
+        plants[i] = cls(*args)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return ((after - before) / n)
+
+
+def bench_plant_types(n) -> None:
+    '''
+        bench_plant_types() display the bytes per plant of the __dict__
+        hierarchy against the __slots__ one
+    '''
+    plant_types = [
+        ("SecurePlant", SecurePlant, CompactSecurePlant,
+         ("rose", 1, 15, 1, 80)),
+        ("Flower", Flower, CompactFlower, ("rose", 1, 15, 1, 80, "red")),
+        ("Tree", Tree, CompactTree, ("oak", 365, 500, 1, 1500, 50, 150)),
+        ("Vegetable", Vegetable, CompactVegetable,
+         ("tomato", 90, 80, 3, 200, "summer", "vitamin C")),
+    ]
+    print(f"=== Memory benchmark ({n} plants per type) ===")
+    for name, old_cls, new_cls, args in plant_types:
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            old = bytes_per_plant(old_cls, args, n)
+            new = bytes_per_plant(new_cls, args, n)
+        print(f"{name:>11}: __dict__ {old:6.1f} B/plant,", end=' ')
+        print(f"__slots__ {new:6.1f} B/plant ({new / old:.0%})")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        bench_plant_types(int(sys.argv[1]))
+    else:
+        bench_plant_types(1000000)
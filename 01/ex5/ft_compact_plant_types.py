@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+
+class CompactSecurePlant:
+    '''
+        CompactSecurePlant class is the __slots__ version of SecurePlant :
+        same encapsulation and same security rules, but the attributes are
+        stored in fixed slots instead of a per-instance __dict__
+    '''
+    __slots__ = ("__name", "__grow_speed", "__max_height", "__age",
+                 "__height", "__starting_height")
+
+    def __init__(self, name, age, height, grow_speed, max_height) -> None:
+        self.__name = name.capitalize()
+        self.__grow_speed = grow_speed
+        self.__max_height = max_height
+        if self.set_age(age) is False:
+            self.__age = 0
+        if self.set_height(height) is False:
+            self.__height = 0
+        self.__starting_height = self.get_height()
+
+    def get_name(self) -> str:
+        '''
+            get_name() is a method that return the name of the plant
+        '''
+        return (self.__name)
+
+    def get_age(self) -> int:
+        '''
+            get_age() is a method that return the age of the plant
+        '''
+        return self.__age
+
+    def set_age(self, age) -> bool:
+        '''
+            set_age() is a method that set the age of the plant with security
+            (age cannot be a negative value)
+        '''
+        name = self.get_name()
+        if age >= 0:
+            self.__age = age
+            print(f'{name}: Age updated: {age} day{(age > 1) * "s"} [OK]')
+            return True
+        else:
+            print(f'{name}: Invalid operation : age {age} day. [KO]')
+            return False
+
+    def get_height(self) -> int:
+        '''
+            get_height() is a method that return the height of the plant
+        '''
+        return self.__height
+
+    def set_height(self, height) -> bool:
+        '''
+            set_height() is a method that set the height of the plant
+            with security (height cannot be a negative value or greater than
+            the max height).
+        '''
+        name = self.get_name()
+        if height >= 0:
+            self.__height = height
+            if self.__height > self.__max_height:
+                self.__height = self.__max_height
+            print(f'{name}: height updated: {self.__height} [OK]')
+            return True
+        else:
+            print(f'{name}: Invalid operation : height {height}cm. [KO]')
+            return False
+
+    def print_plant(self) -> None:
+        '''
+            print_plant() is a method that display informations about a plant
+        '''
+        name = self.get_name()
+        age = self.get_age()
+        height = self.get_height()
+        print(f'{name}: {height}cm, {age} day{(age > 0) * "s"} old')
+
+
+class CompactFlower(CompactSecurePlant):
+    '''
+        CompactFlower is the __slots__ version of Flower
+    '''
+    __slots__ = ("__color", "__bloomed")
+
+    def __init__(self, name, age, height, grow_speed, max_height,
+                 color) -> None:
+        super().__init__(name, age, height, grow_speed, max_height)
+        self.__color = color
+        self.__bloomed = False
+
+    def get_color(self) -> str:
+        '''
+            get_color() method return the flower's color
+        '''
+        return (self.__color)
+
+    def bloom(self) -> None:
+        '''
+            bloom() method set the flower at bloomed
+        '''
+        if (self.__bloomed is False):
+            self.__bloomed = True
+            print(f'{self.get_name()} is blooming beautiffuly!')
+        else:
+            print(f'{self.get_name()} is already bloomed.')
+
+    def change_color(self, color) -> None:
+        '''
+            change_color() method change the flower's color
+        '''
+        self.__color = color
+        print(f'{self.get_name()} changed it color to {self.get_color()}!')
+
+    def print_flower(self) -> None:
+        '''
+            print_flower() is a method that display informations about a flower
+        '''
+        name = self.get_name()
+        age = self.get_age()
+        height = self.get_height()
+        color = self.get_color()
+        print(f'{name} (Flower): {height}cm, {age}', end=' ')
+        print(f'day{(age > 0) * "s"}, {color} color')
+
+
+class CompactTree(CompactSecurePlant):
+    '''
+        CompactTree is the __slots__ version of Tree
+    '''
+    __slots__ = ("__max_trunk_diameter", "__trunk_diameter")
+
+    def __init__(self, name, age, height, grow_speed, max_height,
+                 trunk_diameter, max_trunk_diameter) -> None:
+        super().__init__(name, age, height, grow_speed, max_height)
+        self.__max_trunk_diameter = max_trunk_diameter
+        if (trunk_diameter > max_trunk_diameter):
+            self.__trunk_diameter = max_trunk_diameter
+        else:
+            self.__trunk_diameter = trunk_diameter
+
+    def produce_sade(self) -> None:
+        '''
+            produce_shade() method produce the shade of the tree
+        '''
+        shade_area = self.__trunk_diameter / 10 * self.get_height() / 100
+        print(f'{self.get_name()} provides {shade_area} square meter', end='')
+        print(f'{(shade_area > 1) * "s"} of shade!')
+
+    def get_trunk_diameter(self) -> int:
+        '''
+            get_trunk_diameter() method return the trunk diameter of the tree
+        '''
+        return (self.__trunk_diameter)
+
+    def print_tree(self):
+        '''
+            print_tree() is a method that display informations about a tree
+        '''
+        name = self.get_name()
+        age = self.get_age()
+        height = self.get_height()
+        trunk_diameter = self.get_trunk_diameter()
+        print(f'{name} (Tree): {height}cm, {age}', end=' ')
+        print(f'day{(age > 0) * "s"}, {trunk_diameter}cm diameter')
+
+
+class CompactVegetable(CompactSecurePlant):
+    '''
+        CompactVegetable is the __slots__ version of Vegetable
+    '''
+    __slots__ = ("__harvest_season", "__nutritonal_value")
+
+    def __init__(self, name, age, height, grow_speed, max_height,
+                 harvest_season, nutritional_value) -> None:
+        super().__init__(name, age, height, grow_speed, max_height)
+        self.__harvest_season = harvest_season
+        self.__nutritonal_value = nutritional_value
+
+    def get_harvest_seson(self) -> str:
+        '''
+            get_harvest_season() method return the vegetable's harvest season
+        '''
+        return (self.__harvest_season)
+
+    def get_nutritional_value(self) -> str:
+        '''
+            get_nutritional_value() mathod return the vegetable's nutritional
+            value
+        '''
+        return (self.__nutritonal_value)
+
+    def print_vegetable(self):
+        '''
+            print_vegetable() is a method that display informations about a
+            vegetable
+        '''
+        name = self.get_name()
+        age = self.get_age()
+        height = self.get_height()
+        harvest_season = self.get_harvest_seson()
+        print(f'{name} (Vegetable): {height}cm, {age}', end=' ')
+        print(f'day{(age > 0) * "s"}, {harvest_season} harvest,', end=' ')
+        print(f'rich in {self.get_nutritional_value()}')
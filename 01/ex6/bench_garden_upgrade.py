@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+import os
+import resource
+import sys
+from contextlib import redirect_stdout
+
+from ft_garden_analytics import Garden, Flower, Tree, Vegetable, \
+    FloweringPlant, PrizeFlower
+
+
+def count_classes() -> int:
+    '''
+        count_classes() return the number of classes deriving from the
+        upgrade levels (FloweringPlant and PrizeFlower)
+    '''
+    return (len(FloweringPlant.__subclasses__())
+            + len(PrizeFlower.__subclasses__()))
+
+
+def bench_garden_upgrade(n, waterings) -> None:
+    '''
+        bench_garden_upgrade() water a garden of n plants several times and
+        display the number of upgrade classes and the peak RSS after each
+        watering
+    '''
+    garden = Garden("Bench")
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        for i in range(n):
+            if i % 3 == 0:
+                garden.add_plant(Flower("rose", 1, 10, 5, 50, "red"),
+                                 "Flower")
+            elif i % 3 == 1:
+                garden.add_plant(Tree("oak", 5, 100, 2, 500, 30, 100),
+                                 "Tree")
+            else:
+                garden.add_plant(Vegetable("carrot", 0, 5, 10, 30,
+                                           "Summer", "vitamin A"),
+                                 "Vegetable")
+    print(f"=== Upgrade benchmark ({n} plants) ===")
+    for i in range(waterings):
+        with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+            garden.water_all()
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        score = garden.get_score(verify=True)
+        print(f"Watering {i + 1}: {count_classes()} upgrade classes,", end=' ')
+        print(f"peak RSS {rss // 1024} MiB, score {score}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        bench_garden_upgrade(int(sys.argv[1]), 5)
+    else:
+        bench_garden_upgrade(100000, 5)
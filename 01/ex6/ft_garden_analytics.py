@@ -6,32 +6,61 @@ class GardenManager:
         self.__garden_list = []
 
     class GardenStats:
-        '''Small report class that computes aggregate stats for gardens.'''
-        def __init__(self, garden_list):
-            '''Compute and print aggregate statistics for a list of gardens.
+        '''Small report class that computes aggregate stats for gardens.
+
+        Stats are computed map-reduce style: gardens are split in shards,
+        each shard gives a partial aggregate (a plain dict) and partials
+        are merged. Partials computed elsewhere can be merged the same way.
+        '''
+        KEYS = ("gardens", "score", "plants", "flower", "tree", "vegetable")
+
+        def __init__(self, garden_list, shard_size=1024):
+            '''Compute aggregate statistics for a list of gardens.
 
             Args:
                 garden_list: iterable of Garden instances to aggregate.
+                shard_size: number of gardens per partial aggregate.
             '''
-            total_garden = 0
-            total_score = 0
-            total_plants = 0
-            total_flower = 0
-            total_tree = 0
-            total_vegetable = 0
+            garden_list = list(garden_list)
+            shards = [garden_list[i:i + shard_size]
+                      for i in range(0, len(garden_list), shard_size)]
+            self.__stats = self.merge(self.partial(shard)
+                                      for shard in shards)
+
+        @classmethod
+        def partial(cls, garden_list) -> dict:
+            '''Return the partial aggregate of a shard of gardens.'''
+            stats = dict.fromkeys(cls.KEYS, 0)
             for garden in garden_list:
-                total_garden += 1
-                total_score += garden.get_score()
-                total_plants += garden.get_plants_num()
-                total_flower += garden.get_plant_type("Flower")
-                total_tree += garden.get_plant_type("Tree")
-                total_vegetable += garden.get_plant_type("Vegetable")
-            print(f"Garden managed : {total_garden}")
-            print(f"Total score : {total_score}")
-            print(f"Total plants : {total_plants}")
-            print(f"\nTotal flower : {total_flower}")
-            print(f"Total tree : {total_tree}")
-            print(f"Total vegetable : {total_vegetable}")
+                stats["gardens"] += 1
+                stats["score"] += garden.get_score()
+                stats["plants"] += garden.get_plants_num()
+                stats["flower"] += garden.get_plant_type("Flower")
+                stats["tree"] += garden.get_plant_type("Tree")
+                stats["vegetable"] += garden.get_plant_type("Vegetable")
+            return (stats)
+
+        @classmethod
+        def merge(cls, partials) -> dict:
+            '''Merge partial aggregates into a single one.'''
+            stats = dict.fromkeys(cls.KEYS, 0)
+            for partial in partials:
+                for key in cls.KEYS:
+                    stats[key] += partial[key]
+            return (stats)
+
+        def as_dict(self) -> dict:
+            '''Return a copy of the aggregated statistics.'''
+            return (dict(self.__stats))
+
+        def print_stats(self) -> None:
+            '''Print the aggregated statistics.'''
+            print(f"Garden managed : {self.__stats['gardens']}")
+            print(f"Total score : {self.__stats['score']}")
+            print(f"Total plants : {self.__stats['plants']}")
+            print(f"\nTotal flower : {self.__stats['flower']}")
+            print(f"Total tree : {self.__stats['tree']}")
+            print(f"Total vegetable : {self.__stats['vegetable']}")
 
     def create_garden(self, owner) -> 'Garden':
         '''Create a Garden for `owner`, register it and return it.'''
@@ -62,9 +91,13 @@ class GardenManager:
         '''Return the Garden at `index` in the manager's list.'''
         return (self.__garden_list[index])
 
+    def compute_stats(self) -> dict:
+        '''Return aggregate statistics for all managed gardens.'''
+        return (self.GardenStats(self.__garden_list).as_dict())
+
     def get_stats(self):
         '''Compute and print aggregate statistics for all managed gardens.'''
-        self.GardenStats(self.__garden_list)
+        self.GardenStats(self.__garden_list).print_stats()
 
 
 class Garden:
@@ -75,6 +108,7 @@ class Garden:
         self.__plants = []
         self.__plants_num = 0
         self.__plants_type = {"Tree": 0, "Vegetable": 0, "Flower": 0}
+        self.__plants_level = {"FloweringPlant": 0, "PrizeFlower": 0}
 
     def __get_min(self) -> int:
         '''Return the minimum count among plant types.
@@ -88,21 +122,53 @@ class Garden:
             min = self.__plants_type["Flower"]
         return (min)
 
-    def get_score(self) -> int:
-        '''Compute and return the garden score.
+    @staticmethod
+    def __get_level(plant) -> str | None:
+        '''Return the upgrade level name of `plant`, or None.'''
+        level = plant.__class__.__bases__[0]
+        if level == FloweringPlant:
+            return ("FloweringPlant")
+        elif level == PrizeFlower:
+            return ("PrizeFlower")
+        return (None)
+
+    def __update_level(self, level, delta) -> None:
+        '''Add `delta` to the counter of the upgrade `level` (if any).'''
+        if level is not None:
+            self.__plants_level[level] += delta
+
+    def get_score(self, verify=False) -> int:
+        '''Return the garden score.
 
         The score is based on counts of plant types and bonuses for
-        flowering/prize upgrades.
+        flowering/prize upgrades. It is read from counters maintained by
+        `add_plant` and `upgrade_plant`; with `verify`, it is also checked
+        against a full rescan and an Exception is raised on mismatch.
         '''
         score = self.__plants_type["Tree"]
         score += self.__plants_type["Vegetable"]
         score += self.__plants_type["Flower"]
         score += self.__get_min() * 5
+        score += self.__plants_level["FloweringPlant"]
+        score += self.__plants_level["PrizeFlower"] * 3
+        if verify:
+            rescanned = self.compute_score()
+            if rescanned != score:
+                raise Exception(f"Score mismatch: {score} maintained, "
+                                f"{rescanned} rescanned")
+        return (score)
+
+    def compute_score(self) -> int:
+        '''Compute the garden score with a full rescan of the plants.'''
+        score = self.__plants_type["Tree"]
+        score += self.__plants_type["Vegetable"]
+        score += self.__plants_type["Flower"]
+        score += self.__get_min() * 5
         for plant in self.__plants:
-            level = plant["plant"].__class__.__bases__[0]
-            if level == FloweringPlant:
+            level = self.__get_level(plant["plant"])
+            if level == "FloweringPlant":
                 score += 1
-            elif level == PrizeFlower:
+            elif level == "PrizeFlower":
                 score += 3
         return (score)
 
@@ -138,33 +204,51 @@ class Garden:
             self.__plants.append({"type": type, "plant": plant})
             self.__plants_num += 1
             self.add_plant_type(type)
+            self.__update_level(self.__get_level(plant), 1)
             name = plant.get_name()
             owner = self.get_owner()
             print(f"Added {name} to {owner}'s garden.")
         else:
             print(f"{type} isn't an type.")
 
+    __rebased_classes = {}
+    __rebase_origins = {}
+
     @staticmethod
     def rebase(cls, *new_bases):
-        '''Create a new class object that reuses `cls`'s dict.
+        '''Return a class object that reuses `cls`'s dict.
 
         The returned type has the same name and dict but different bases.
-        '''
-        return type(cls.__name__, new_bases, dict(cls.__dict__))
+        It is created once per (original class, new bases) and cached, so
+        rebasing an already rebased class does not mint a new type.
+        '''
+        origin = Garden.__rebase_origins.get(cls, cls)
+        key = (origin, new_bases)
+        rebased = Garden.__rebased_classes.get(key)
+        if rebased is None:
+            rebased = type(origin.__name__, new_bases, dict(origin.__dict__))
+            Garden.__rebased_classes[key] = rebased
+            Garden.__rebase_origins[rebased] = origin
+        return rebased
 
     def upgrade_plant(self, plant):
         '''Upgrade a plant's inheritance to FloweringPlant then PrizeFlower.
 
         The function changes the instance's class so it gains behaviors from
         the target base classes. Existing instance attributes are preserved.
+        `plant` is expected to belong to this garden, its upgrade level is
+        counted in the garden score.
         '''
         cur_cls = plant.__class__
+        level = self.__get_level(plant)
         if issubclass(cur_cls, SecurePlant):
             plant.__class__ = self.rebase(cur_cls, FloweringPlant)
             print(f"{plant.get_name()} has been upgraded !")
         elif issubclass(cur_cls, FloweringPlant):
             plant.__class__ = self.rebase(cur_cls, PrizeFlower)
             print(f"{plant.get_name()} has been upgraded !")
+        self.__update_level(level, -1)
+        self.__update_level(self.__get_level(plant), 1)
 
     def water_all(self):
         '''Call `upgrade_plant` for every plant in the garden.
@@ -1,15 +1,149 @@
 #!/usr/bin/env python3
 
+import math
+import random
 import sys
 
 
+class ScoreStats:
+    '''
+    Running statistics over a stream of scores in constant memory: count,
+    sum, min, max, Welford mean/variance and approximate percentiles
+    computed from a fixed-size reservoir sample.
+    '''
+    def __init__(self, sample_size: int = 10000, seed: int = 42) -> None:
+        self.count = 0
+        self.total = 0
+        self.low = None
+        self.high = None
+        self.__mean = 0.0
+        self.__m2 = 0.0
+        self.__sample_size = sample_size
+        self.__sample: list[int] = []
+        self.__random = random.Random(seed)
+
+    def update(self, score: int) -> None:
+        '''
+        Adds one score to the statistics.
+        '''
+        self.count += 1
+        self.total += score
+        if self.high is None or self.high < score:
+            self.high = score
+        if self.low is None or self.low > score:
+            self.low = score
+
+        delta = score - self.__mean
+        self.__mean += delta / self.count
+        self.__m2 += delta * (score - self.__mean)
+
+        if len(self.__sample) < self.__sample_size:
+            self.__sample.append(score)
+        else:
+            i = self.__random.randrange(self.count)
+            if i < self.__sample_size:
+                self.__sample[i] = score
+
+    def get_mean(self) -> float:
+        '''
+        Returns the average score.
+        '''
+        return self.__mean
+
+    def get_variance(self) -> float:
+        '''
+        Returns the population variance of the scores.
+        '''
+        if self.count == 0:
+            return 0.0
+        return self.__m2 / self.count
+
+    def get_percentile(self, percent: float) -> int | None:
+        '''
+        Returns the approximate score under which percent % of the scores
+        fall (exact while the stream fits in the sample).
+        '''
+        if not self.__sample:
+            return None
+        sample = sorted(self.__sample)
+        index = math.ceil(percent / 100 * len(sample)) - 1
+        return sample[min(max(index, 0), len(sample) - 1)]
+
+
+def read_scores(file, chunk_size: int = 1 << 20):
+    '''
+    Yields the whitespace separated tokens of a text file, reading it by
+    chunks of chunk_size characters. A token cut by a chunk edge is kept
+    until the next chunk.
+    '''
+    pending = ""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        tokens = (pending + chunk).split()
+        if tokens and not chunk[-1].isspace():
+            pending = tokens.pop()
+        else:
+            pending = ""
+        yield from tokens
+    if pending:
+        yield pending
+
+
+def ft_stream_score_analytics(file) -> None:
+    '''
+    Displays analytics for player scores read from a file in one pass
+    with bounded memory.
+    '''
+    stats = ScoreStats()
+
+    for token in read_scores(file):
+        try:
+            score = int(token)
+        except Exception:
+            print(f"Oops, {token} is not a valid score.")
+            return
+        stats.update(score)
+
+    if stats.count == 0:
+        print("No scores provided.")
+        return
+
+    print("=== Player Score Analytics (stream) ===")
+    print(f"Total players: {stats.count}")
+    print(f"Total score: {stats.total}")
+    print(f"Average score: {stats.get_mean()}")
+    print(f"Standard deviation: {math.sqrt(stats.get_variance())}")
+    print(f"High score: {stats.high}")
+    print(f"Low score: {stats.low}")
+    print(f"Score range: {stats.high - stats.low}")
+    print(f"Median (approx.): {stats.get_percentile(50)}")
+    print(f"90th percentile (approx.): {stats.get_percentile(90)}")
+    print(f"99th percentile (approx.): {stats.get_percentile(99)}\n")
+
+
 def ft_score_analytics() -> None:
     '''
     Displays analytics for player scores provided as command-line arguments.
+    With --stream, scores are read from the given file (or stdin).
     '''
     argv = sys.argv
     argc = len(argv)
 
+    if argc > 1 and argv[1] == "--stream":
+        if argc > 3:
+            print("Usage: ./ft_score_analytics.py --stream [file]")
+        elif argc == 3:
+            try:
+                with open(argv[2]) as file:
+                    ft_stream_score_analytics(file)
+            except OSError as e:
+                print(f"Error: {e}")
+        else:
+            ft_stream_score_analytics(sys.stdin)
+        return
+
     player_count = argc - 1
     player_scores = []
 
@@ -18,7 +152,7 @@ def ft_score_analytics() -> None:
 
     if argc < 2:
         print("No scores provided. Usage: ./ft_score_analytics.py\
- <score1> <score2> ...")
+ <score1> <score2> ... (or --stream [file])")
         return
     for arg in argv[1:]:
         try:
@@ -2,17 +2,32 @@
 
 import sys
 import math
+import re
+import heapq
+from array import array
 
 
-def calculate_distance(coord1: tuple[int, int, int],
-                       coord2: tuple[int, int, int]) -> None:
+COORD_PATTERN = re.compile(
+    r"\(\s*(-?\d+)\s*,\s*(-?\d+)\s*,\s*(-?\d+)\s*,?\s*\)")
+
+
+def get_distance(coord1: tuple[int, int, int],
+                 coord2: tuple[int, int, int]) -> float:
     '''
-    Calculates and prints the Euclidean distance between two 3D coordinates.
+    Returns the Euclidean distance between two 3D coordinates.
     '''
     x1, y1, z1 = coord1
     x2, y2, z2 = coord2
 
-    distance = math.sqrt((x2-x1)**2 + (y2-y1)**2 + (z2-z1)**2)
+    return math.sqrt((x2-x1)**2 + (y2-y1)**2 + (z2-z1)**2)
+
+
+def calculate_distance(coord1: tuple[int, int, int],
+                       coord2: tuple[int, int, int]) -> None:
+    '''
+    Calculates and prints the Euclidean distance between two 3D coordinates.
+    '''
+    distance = get_distance(coord1, coord2)
     print(f"Distance between {coord1} and {coord2}: {distance}")
 
 
@@ -53,6 +68,270 @@ def parse_coordinates() -> list[tuple[int, int, int]]:
     return tuples_coords
 
 
+def parse_coordinates_bulk(payload: str) -> array:
+    '''
+    Parses a payload of coordinates "[(x, y, z), (x, y, z) ...]" in one
+    pass and returns them as a flat array of N * 3 integers
+    (x0, y0, z0, x1, y1, z1, ...).
+    '''
+    matches = COORD_PATTERN.findall(payload)
+
+    if len(matches) != payload.count("("):
+        raise Exception("Parsing error: coordinates take only 3 values\
+: (x, y, z)")
+    coords = array("q")
+    for match in matches:
+        coords.extend(map(int, match))
+    return coords
+
+
+def parse_coordinates_file(file, chunk_size: int = 1 << 20) -> array:
+    '''
+    Parses the coordinates of a text file by chunks of chunk_size
+    characters and returns them as a flat array of N * 3 integers.
+    A coordinate cut by a chunk edge is kept until the next chunk.
+    '''
+    coords = array("q")
+    pending = ""
+
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        payload = pending + chunk
+        end = payload.rfind(")") + 1
+        start = payload.rfind("(")
+        if start < end:
+            end = len(payload)
+        coords.extend(parse_coordinates_bulk(payload[:end]))
+        pending = payload[end:]
+    coords.extend(parse_coordinates_bulk(pending))
+    return coords
+
+
+def get_points(coords: array) -> list[tuple[int, int, int]]:
+    '''
+    Returns the points of a flat coordinates array as (x, y, z) tuples.
+    '''
+    return list(zip(coords[0::3], coords[1::3], coords[2::3]))
+
+
+def origin_distances(coords: array) -> array:
+    '''
+    Returns the Euclidean distance of every point to (0, 0, 0).
+    '''
+    return array("d", map(math.hypot, coords[0::3], coords[1::3],
+                          coords[2::3]))
+
+
+def path_lengths(coords: array) -> array:
+    '''
+    Returns the distance between every pair of consecutive points.
+    '''
+    points = get_points(coords)
+    return array("d", map(math.dist, points, points[1:]))
+
+
+def all_pairs_distances(coords: array) -> list[array]:
+    '''
+    Returns the N x N matrix of distances between every pair of points,
+    one array per row.
+    '''
+    points = get_points(coords)
+    return [array("d", [math.dist(point, other) for other in points])
+            for point in points]
+
+
+class SpatialGrid:
+    '''
+    Uniform grid index over 3D positions: every position is stored in the
+    cube cell of side cell_size containing it, so nearest, radius and
+    bounding box queries only look at the cells around the query.
+    '''
+    def __init__(self, cell_size: float = 1.0) -> None:
+        if cell_size <= 0:
+            raise Exception("SpatialGrid error: cell size must be positive")
+        self.__cell_size = cell_size
+        self.__positions: list[tuple[int, int, int]] = []
+        self.__cells: dict[tuple[int, int, int], list[int]] = {}
+        self.__low = None
+        self.__high = None
+
+    @classmethod
+    def from_positions(cls,
+                       positions: list[tuple[int, int, int]],
+                       cell_size: float | None = None) -> 'SpatialGrid':
+        '''
+        Builds a grid from a list of positions. Without cell_size, the
+        cell size is chosen to hold about one position per cell.
+        '''
+        if cell_size is None:
+            cell_size = 1.0
+            if positions:
+                volume = 1.0
+                for axis in zip(*positions):
+                    volume *= max(axis) - min(axis) + 1
+                cell_size = max((volume / len(positions)) ** (1 / 3), 1.0)
+        grid = cls(cell_size)
+        for position in positions:
+            grid.insert(position)
+        return grid
+
+    def __len__(self) -> int:
+        return len(self.__positions)
+
+    def __get_cell(self, position) -> tuple[int, int, int]:
+        '''
+        Returns the cell containing position.
+        '''
+        x, y, z = position
+        size = self.__cell_size
+        return (math.floor(x / size), math.floor(y / size),
+                math.floor(z / size))
+
+    def insert(self, position: tuple[int, int, int]) -> int:
+        '''
+        Adds a position to the index and returns its id.
+        '''
+        position_id = len(self.__positions)
+        cell = self.__get_cell(position)
+
+        self.__positions.append(position)
+        self.__cells.setdefault(cell, []).append(position_id)
+        if self.__low is None:
+            self.__low = cell
+            self.__high = cell
+        else:
+            self.__low = tuple(map(min, self.__low, cell))
+            self.__high = tuple(map(max, self.__high, cell))
+        return position_id
+
+    def get_position(self, position_id: int) -> tuple[int, int, int]:
+        '''
+        Returns the position of the given id.
+        '''
+        return self.__positions[position_id]
+
+    def __get_cells_in_box(self, low_cell, high_cell):
+        '''
+        Yields the ids stored in the cells between low_cell and high_cell,
+        scanning the occupied cells instead when the box is larger.
+        '''
+        box = 1
+        for low, high in zip(low_cell, high_cell):
+            box *= max(high - low + 1, 0)
+        if box > len(self.__cells):
+            for cell, ids in self.__cells.items():
+                if all(low <= c <= high
+                       for low, c, high in zip(low_cell, cell, high_cell)):
+                    yield from ids
+            return
+        for x in range(low_cell[0], high_cell[0] + 1):
+            for y in range(low_cell[1], high_cell[1] + 1):
+                for z in range(low_cell[2], high_cell[2] + 1):
+                    yield from self.__cells.get((x, y, z), ())
+
+    def bounding_box(self,
+                     low: tuple[int, int, int],
+                     high: tuple[int, int, int]
+                     ) -> list[tuple[int, int, int]]:
+        '''
+        Returns the positions p with low <= p <= high on every axis.
+        '''
+        found = []
+
+        for position_id in self.__get_cells_in_box(self.__get_cell(low),
+                                                   self.__get_cell(high)):
+            position = self.__positions[position_id]
+            if all(lo <= c <= hi for lo, c, hi in zip(low, position, high)):
+                found.append(position)
+        return found
+
+    def radius(self,
+               center: tuple[int, int, int],
+               radius: float) -> list[tuple[int, int, int]]:
+        '''
+        Returns the positions at a distance of at most radius from center.
+        '''
+        low = tuple(c - radius for c in center)
+        high = tuple(c + radius for c in center)
+        found = []
+
+        for position_id in self.__get_cells_in_box(self.__get_cell(low),
+                                                   self.__get_cell(high)):
+            position = self.__positions[position_id]
+            if get_distance(center, position) <= radius:
+                found.append(position)
+        return found
+
+    def __get_shell(self, cell, ring: int):
+        '''
+        Yields the cells at a Chebyshev distance of exactly ring from cell.
+        '''
+        cx, cy, cz = cell
+        for dx in range(-ring, ring + 1):
+            for dy in range(-ring, ring + 1):
+                if max(abs(dx), abs(dy)) == ring:
+                    dzs = range(-ring, ring + 1)
+                else:
+                    dzs = (-ring, ring) if ring else (0,)
+                for dz in dzs:
+                    yield (cx + dx, cy + dy, cz + dz)
+
+    def nearest(self,
+                center: tuple[int, int, int],
+                k: int = 1) -> list[tuple[float, tuple[int, int, int]]]:
+        '''
+        Returns the k positions nearest to center as (distance, position)
+        pairs, nearest first. Rings of cells are searched outward from the
+        cell of center until no unvisited cell can hold a nearer position.
+        '''
+        if k <= 0 or not self.__positions:
+            return []
+        cell = self.__get_cell(center)
+        max_ring = max(max(abs(c - low), abs(high - c)) for c, low, high
+                       in zip(cell, self.__low, self.__high))
+        found = []
+        ring = 0
+
+        while ring <= max_ring:
+            shell_size = (2 * ring + 1) ** 3 - max(2 * ring - 1, 0) ** 3
+            if shell_size > len(self.__cells):
+                found = [(get_distance(center, position), position_id)
+                         for position_id, position
+                         in enumerate(self.__positions)]
+                break
+            for shell_cell in self.__get_shell(cell, ring):
+                for position_id in self.__cells.get(shell_cell, ()):
+                    position = self.__positions[position_id]
+                    found.append((get_distance(center, position),
+                                  position_id))
+            if len(found) >= k:
+                kth = heapq.nsmallest(k, found)[-1][0]
+                if kth <= ring * self.__cell_size:
+                    break
+            ring += 1
+        return [(distance, self.__positions[position_id])
+                for distance, position_id in heapq.nsmallest(k, found)]
+
+
+def ft_bulk_coordinate_system(file) -> None:
+    '''
+    Parses a large payload of coordinates from a file and displays the
+    length of the path going through them.
+    '''
+    try:
+        coords = parse_coordinates_file(file)
+    except Exception as e:
+        print(e)
+        return
+    points = len(coords) // 3
+    print(f"Parsed positions: {points}")
+    if points > 0:
+        print(f"Farthest from origin: {max(origin_distances(coords))}")
+        print(f"Path length: {math.fsum(path_lengths(coords))}")
+
+
 def create_position(x: int, y: int, z: int) -> tuple[int, int, int]:
     '''
     Creates a 3D coordinate position from x, y, and z values.
@@ -114,4 +393,14 @@ def ft_coordinate_system() -> None:
 
 
 if __name__ == "__main__":
-    ft_coordinate_system()
+    if len(sys.argv) > 1 and sys.argv[1] == "--bulk":
+        if len(sys.argv) == 3:
+            try:
+                with open(sys.argv[2]) as file:
+                    ft_bulk_coordinate_system(file)
+            except OSError as e:
+                print(f"Error: {e}")
+        else:
+            ft_bulk_coordinate_system(sys.stdin)
+    else:
+        ft_coordinate_system()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+import random
+import sys
+from time import perf_counter
+
+from ft_achievement_tracker import Player, AchievementRegistry
+
+
+def set_flow(achievement_sets: list[set[str]]) -> tuple:
+    '''
+        set_flow runs the ft_achievement_tracker analytics with sets.
+    '''
+    all_achievements = set()
+    for achievements in achievement_sets:
+        all_achievements = all_achievements.union(achievements)
+    common_to_all = achievement_sets[0].intersection(*achievement_sets[1:])
+    seen_once = set()
+    seen_twice = set()
+    for achievements in achievement_sets:
+        seen_twice |= seen_once & achievements
+        seen_once |= achievements
+    rare = seen_once - seen_twice
+    unique = achievement_sets[0] - achievement_sets[1]
+    return (all_achievements, common_to_all, rare, unique)
+
+
+def bitset_flow(masks: list[int]) -> tuple:
+    '''
+        bitset_flow runs the same analytics on achievement bitmasks.
+    '''
+    all_achievements = AchievementRegistry.union(masks)
+    common_to_all = AchievementRegistry.intersection(masks)
+    rare = AchievementRegistry.rare(masks)
+    unique = masks[0] & ~masks[1]
+    return (all_achievements, common_to_all, rare, unique)
+
+
+def bench_achievement_tracker(n: int) -> None:
+    '''
+        bench_achievement_tracker compares the set and bitmask analytics
+        over n players. Building the sets and encoding the bitmasks (what
+        Player does on creation) are timed with their analytics.
+    '''
+    random.seed(42)
+    pool = [f"achievement_{i}" for i in range(100)]
+    raw = [random.sample(pool, 20) for _ in range(n)]
+    raw.append(["secret_ending"])
+
+    start = perf_counter()
+    achievement_sets = [set(achievements) for achievements in raw]
+    build = perf_counter() - start
+
+    start = perf_counter()
+    set_result = set_flow(achievement_sets)
+    sets = perf_counter() - start
+
+    start = perf_counter()
+    masks = [Player.registry.encode(achievements) for achievements in raw]
+    encode = perf_counter() - start
+
+    start = perf_counter()
+    bitset_result = bitset_flow(masks)
+    bitsets = perf_counter() - start
+
+    for expected, mask in zip(set_result, bitset_result):
+        assert expected == Player.registry.decode(mask)
+
+    print(f"=== Achievement benchmark ({len(raw)} players) ===")
+    print(f"Set build: {build:.3f}s, analytics: {sets:.3f}s")
+    print(f"Encoding: {encode:.3f}s, bitset analytics: \
+{bitsets:.3f}s")
+    print(f"Analytics only: {sets / bitsets:.0f}x")
+    print(f"Including build/encoding: \
+{(build + sets) / (encode + bitsets):.2f}x")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        bench_achievement_tracker(int(sys.argv[1]))
+    else:
+        bench_achievement_tracker(100000)
@@ -1,9 +1,125 @@
 #!/usr/bin/env python3
 
+class AchievementRegistry:
+    '''
+        AchievementRegistry interns each achievement string to a small
+        integer, so a set of achievements can be stored as an int bitmask
+        and unions, intersections and differences become bitwise operations.
+    '''
+    def __init__(self) -> None:
+        self.__bits: dict[str, int] = {}
+        self.__names: list[str] = []
+
+    def intern(self, achievement: str) -> int:
+        '''
+            intern is a method that returns the bit of achievement,
+            registering it on first use.
+        '''
+        bit = self.__bits.get(achievement)
+        if bit is None:
+            bit = len(self.__names)
+            self.__bits[achievement] = bit
+            self.__names.append(achievement)
+        return bit
+
+    def get_bit(self, achievement: str) -> int | None:
+        '''
+            get_bit is a method that returns the bit of achievement, or None
+            if it was never registered.
+        '''
+        return self.__bits.get(achievement)
+
+    def encode(self, achievements) -> int:
+        '''
+            encode is a method that returns the bitmask of an iterable of
+            achievements.
+        '''
+        mask = 0
+        for achievement in achievements:
+            mask |= 1 << self.intern(achievement)
+        return mask
+
+    def decode(self, mask: int) -> set[str]:
+        '''
+            decode is a method that returns the set of achievements of a
+            bitmask.
+        '''
+        achievements = set()
+        while mask:
+            low = mask & -mask
+            achievements.add(self.__names[low.bit_length() - 1])
+            mask ^= low
+        return achievements
+
+    @staticmethod
+    def union(masks) -> int:
+        '''
+            union is a static method that returns the union of bitmasks.
+        '''
+        result = 0
+        for mask in masks:
+            result |= mask
+        return result
+
+    @staticmethod
+    def intersection(masks) -> int:
+        '''
+            intersection is a static method that returns the intersection
+            of bitmasks (0 if there is none).
+        '''
+        masks = iter(masks)
+        result = next(masks, 0)
+        for mask in masks:
+            result &= mask
+        return result
+
+    @staticmethod
+    def rare(masks) -> int:
+        '''
+            rare is a static method that returns the bits set in exactly
+            one of the bitmasks.
+        '''
+        once = 0
+        twice = 0
+        for mask in masks:
+            twice |= once & mask
+            once |= mask
+        return once & ~twice
+
+
 class Player:
+    '''
+        Player class stores the achievements of a player as a bitmask over
+        the shared Player.registry
+    '''
+    registry = AchievementRegistry()
+
     def __init__(self, name, achievements):
         self.name = name
-        self.achievements = set(achievements)
+        self.achievements_mask = Player.registry.encode(achievements)
+
+    @property
+    def achievements(self) -> set[str]:
+        '''
+            achievements is the set of the player achievements, decoded from
+            the bitmask.
+        '''
+        return Player.registry.decode(self.achievements_mask)
+
+    def has_achievement(self, achievement: str) -> bool:
+        '''
+            has_achievement is a method that checks the bit of achievement
+            in the player bitmask.
+        '''
+        bit = Player.registry.get_bit(achievement)
+        return bit is not None and self.achievements_mask >> bit & 1 == 1
+
+    def add_achievement(self, achievement: str) -> None:
+        '''
+            add_achievement is a method that sets the bit of achievement in
+            the player bitmask.
+        '''
+        self.achievements_mask |= 1 << Player.registry.intern(achievement)
 
     def print_achievements(self) -> None:
         '''
@@ -57,11 +173,115 @@ def is_rare_achievement(achievement: str,
     '''
     for player in player_list:
         if player != achievement_player:
-            if achievement in player.achievements:
+            if player.has_achievement(achievement):
                 return False
     return True
 
 
+class AchievementIndex:
+    '''
+        AchievementIndex is an inverted index from each achievement to the
+        players that own it. Achievements are also bucketed by number of
+        owners and the achievements owned by a single player are kept per
+        player, so rare, common and unique queries only touch their answer.
+    '''
+    def __init__(self,
+                 player_list: list[Player] | tuple[Player, ...] = ()
+                 ) -> None:
+        self.__owners: dict[str, set[Player]] = {}
+        self.__by_count: dict[int, set[str]] = {}
+        self.__unique: dict[Player, set[str]] = {}
+        self.__player_count = 0
+        for player in player_list:
+            self.add_player(player)
+
+    def add_player(self, player: Player) -> None:
+        '''
+            add_player is a method that registers a player and indexes
+            their current achievements.
+        '''
+        if player in self.__unique:
+            return
+        self.__unique[player] = set()
+        self.__player_count += 1
+        for achievement in player.achievements:
+            self.__index(player, achievement)
+
+    def add_achievement(self, player: Player, achievement: str) -> None:
+        '''
+            add_achievement is a method that gives an achievement to a
+            player and updates the index. The player is registered first if
+            needed, so the index never sees an unknown owner.
+        '''
+        self.add_player(player)
+        if player.has_achievement(achievement):
+            return
+        player.add_achievement(achievement)
+        self.__index(player, achievement)
+
+    def __index(self, player: Player, achievement: str) -> None:
+        '''
+            __index is a method that records that player owns achievement.
+        '''
+        owners = self.__owners.setdefault(achievement, set())
+        count = len(owners)
+        if count > 0:
+            self.__by_count[count].discard(achievement)
+        if count == 1:
+            for owner in owners:
+                self.__unique[owner].discard(achievement)
+        owners.add(player)
+        self.__by_count.setdefault(count + 1, set()).add(achievement)
+        if count == 0:
+            self.__unique[player].add(achievement)
+
+    def get_owner_count(self, achievement: str) -> int:
+        '''
+            get_owner_count is a method that returns the number of players
+            owning achievement.
+        '''
+        return len(self.__owners.get(achievement, ()))
+
+    def is_rare(self, achievement: str) -> bool:
+        '''
+            is_rare is a method that checks if achievement is obtained by
+            only one player.
+        '''
+        return self.get_owner_count(achievement) == 1
+
+    def get_rare_achievements(self) -> set[str]:
+        '''
+            get_rare_achievements is a method that returns the achievements
+            obtained by only one player.
+        '''
+        return set(self.__by_count.get(1, ()))
+
+    def get_common_to_all(self) -> set[str]:
+        '''
+            get_common_to_all is a method that returns the achievements
+            obtained by every registered player.
+        '''
+        if self.__player_count == 0:
+            return set()
+        return set(self.__by_count.get(self.__player_count, ()))
+
+    def get_unique_to(self, player: Player) -> set[str]:
+        '''
+            get_unique_to is a method that returns the achievements that
+            only player has obtained.
+        '''
+        return set(self.__unique.get(player, ()))
+
+    @staticmethod
+    def get_difference(player1: Player, player2: Player) -> set[str]:
+        '''
+            get_difference is a static method that returns the achievements
+            of player1 that player2 does not have.
+        '''
+        mask = player1.achievements_mask & ~player2.achievements_mask
+        return Player.registry.decode(mask)
+
+
 def ft_achievement_tracker() -> None:
     '''
         ft_achievement_tracker is a function that creates players with
@@ -86,36 +306,30 @@ def ft_achievement_tracker() -> None:
 
     print("\n=== Achievements Analytics ===\n")
 
-    all_achievements = set()
     player_list = (alice, bob, charlie)
+    masks = [player.achievements_mask for player in player_list]
 
-    for player in player_list:
-        all_achievements = all_achievements.union(player.achievements)
+    all_achievements = Player.registry.decode(AchievementRegistry.union(masks))
 
     print(f"All unique achievements: {all_achievements}")
     print(f"Total unique achievements: {len(all_achievements)}\n")
 
-    common_to_all = alice.achievements.intersection(bob.achievements,
-                                                    charlie.achievements)
+    common_to_all = Player.registry.decode(
+        AchievementRegistry.intersection(masks))
 
     print(f"Common to all players: {common_to_all}")
 
-    rare_achievements = []
-
-    for player in player_list:
-        for achievement in player.achievements:
-            if is_rare_achievement(achievement, player, player_list):
-                rare_achievements.append(achievement)
-
-    rare_achievements = set(rare_achievements)
+    achievement_index = AchievementIndex(player_list)
+    rare_achievements = achievement_index.get_rare_achievements()
 
     print(f"Rare achievements (1 player): {rare_achievements}\n")
 
     # Player.compare_achievements(alice, bob)
 
-    common_achievements = alice.achievements.intersection(bob.achievements)
-    alice_unique = alice.achievements.difference(common_achievements)
-    bob_unique = bob.achievements.difference(common_achievements)
+    common_mask = alice.achievements_mask & bob.achievements_mask
+    common_achievements = Player.registry.decode(common_mask)
+    alice_unique = AchievementIndex.get_difference(alice, bob)
+    bob_unique = AchievementIndex.get_difference(bob, alice)
 
     print(f"{alice.name} vs {bob.name} common: {common_achievements}")
     print(f"{alice.name} unique: {alice_unique}")
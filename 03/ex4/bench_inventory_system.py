@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+import sys
+from time import perf_counter
+
+from ft_inventory_system import Item, Player
+
+
+TYPES = ("weapon", "armor", "consumable", "material")
+RARITIES = ("common", "uncommon", "rare", "legendary")
+
+
+def bench_inventory_system(n_players, n_items) -> None:
+    '''
+        bench_inventory_system() load n_items items spread across n_players
+        players, then time name, type and rarity lookups
+    '''
+    items_per_player = n_items // n_players
+    players = [Player(f"Player{i}") for i in range(n_players)]
+
+    print(f"=== Inventory benchmark ({n_items} items, {n_players} players) \
+===")
+    start = perf_counter()
+    for player in players:
+        for i in range(items_per_player):
+            player.add_item(Item(f"Item{i}", TYPES[i % 4],
+                                 RARITIES[i % 4], i, 1))
+    load = perf_counter() - start
+    print(f"Load: {load:.2f}s ({load / n_items * 1e9:.0f} ns/item)")
+
+    start = perf_counter()
+    for player in players:
+        for i in range(items_per_player):
+            player.get_item_in_inventory(f"Item{i}")
+    lookup = perf_counter() - start
+    print(f"Name lookups: {lookup:.2f}s ({lookup / n_items * 1e9:.0f} \
+ns/lookup)")
+
+    start = perf_counter()
+    for player in players:
+        player.get_items_name_by_rarity("rare")
+        player.get_items_by_type("weapon")
+    index = perf_counter() - start
+    print(f"Rarity + type lookups: {index:.2f}s ({index / n_players * 1e9:.0f}\
+ ns/player)")
+
+    start = perf_counter()
+    for player in players:
+        player.get_inventory_value()
+        player.get_item_count()
+        player.get_least_abundant_item()
+        player.get_most_abundant_item()
+    analytics = perf_counter() - start
+    print(f"Analytics: {analytics:.2f}s ({analytics / n_players * 1e9:.0f}\
+ ns/player)")
+
+    transfers = [(players[i], players[(i + 1) % n_players],
+                  f"Item{i % items_per_player}", 1)
+                 for i in range(n_players)]
+    start = perf_counter()
+    Player.give_batch(transfers)
+    batch = perf_counter() - start
+    print(f"Batch transfers: {batch:.2f}s ({batch / n_players * 1e9:.0f}\
+ ns/transfer)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2:
+        bench_inventory_system(int(sys.argv[1]), int(sys.argv[2]))
+    else:
+        bench_inventory_system(10000, 1000000)
@@ -1,17 +1,131 @@
 #!/usr/bin/env python3
 
+import heapq
+from array import array
+
+
+class ItemStore:
+    '''
+    Stores items in columns: names in a list, types and rarities interned
+    once and kept as integer codes, values and quantities in typed arrays.
+    An Item is a view over one row, the row is freed when the Item is
+    dropped and reused by the next add_row.
+    '''
+    def __init__(self) -> None:
+        self.__names = []
+        self.__strings = []
+        self.__codes = {}
+        self.__types = array("l")
+        self.__rarities = array("l")
+        self.__values = array("q")
+        self.__quantities = array("q")
+        self.__free = []
+
+    def __len__(self) -> int:
+        return len(self.__names) - len(self.__free)
+
+    def __intern(self, string: str) -> int:
+        '''
+        Returns the code of the string, registering it on first use.
+        '''
+        code = self.__codes.get(string)
+        if code is None:
+            code = len(self.__strings)
+            self.__codes[string] = code
+            self.__strings.append(string)
+        return code
+
+    def add_row(self,
+                name: str,
+                type: str,
+                rarity: str,
+                value: int,
+                quantity: int) -> int:
+        '''
+        Adds an item row to the store and returns its index. A freed row is
+        reused if there is one. The values are checked before any column is
+        changed, so a bad row leaves the store untouched.
+        '''
+        value, quantity = array("q", (value, quantity))
+        type_code = self.__intern(type)
+        rarity_code = self.__intern(rarity)
+
+        if self.__free:
+            row = self.__free.pop()
+            self.__names[row] = name
+            self.__types[row] = type_code
+            self.__rarities[row] = rarity_code
+            self.__values[row] = value
+            self.__quantities[row] = quantity
+            return row
+        self.__names.append(name)
+        self.__types.append(type_code)
+        self.__rarities.append(rarity_code)
+        self.__values.append(value)
+        self.__quantities.append(quantity)
+        return len(self.__names) - 1
+
+    def free_row(self, row: int) -> None:
+        '''
+        Marks a row as dead so that add_row can reuse it.
+        '''
+        self.__names[row] = None
+        self.__free.append(row)
+
+    def get_name(self, row: int) -> str:
+        return self.__names[row]
+
+    def get_type(self, row: int) -> str:
+        return self.__strings[self.__types[row]]
+
+    def get_rarity(self, row: int) -> str:
+        return self.__strings[self.__rarities[row]]
+
+    def get_value(self, row: int) -> int:
+        return self.__values[row]
+
+    def get_quantity(self, row: int) -> int:
+        return self.__quantities[row]
+
+    def set_quantity(self, row: int, quantity: int) -> None:
+        self.__quantities[row] = quantity
+
+
 class Item:
     '''
     Represents an item with a name, type, rarity, value, and quantity.
+    The item is a thin view over a row of an ItemStore (the shared
+    Item.store by default), the row is freed when the item is dropped.
     '''
+    __slots__ = ("__store", "__row")
+
+    store = ItemStore()
+
     def __init__(self,
                  name: str,
                  type: str,
                  rarity: str,
                  value: int,
-                 quantity: int) -> None:
-        self.item = dict(name=name, type=type, rarity=rarity, value=value,
-                         quantity=quantity)
+                 quantity: int,
+                 store: ItemStore | None = None) -> None:
+        self.__row = None
+        if store is None:
+            store = Item.store
+        self.__store = store
+        self.__row = store.add_row(name, type, rarity, value, quantity)
+
+    def __del__(self) -> None:
+        if self.__row is not None:
+            self.__store.free_row(self.__row)
+
+    @property
+    def item(self) -> dict:
+        '''
+        Returns the item as a dict (built on demand from the store row).
+        '''
+        return dict(name=self.get_name(), type=self.get_type(),
+                    rarity=self.get_rarity(), value=self.get_value(),
+                    quantity=self.get_quantity())
 
     def set_quantity(self, quantity: int) -> None:
         '''
@@ -19,7 +133,7 @@ class Item:
         '''
         if quantity < 0:
             quantity = 0
-        self.item.update({"quantity": quantity})
+        self.__store.set_quantity(self.__row, quantity)
 
     def add_quantity(self, quantity: int) -> int:
         '''
@@ -47,31 +161,31 @@ class Item:
         '''
         Returns the name of the item.
         '''
-        return self.item.get("name")
+        return self.__store.get_name(self.__row)
 
     def get_type(self) -> str:
         '''
         Returns the type of the item.
         '''
-        return self.item.get("type")
+        return self.__store.get_type(self.__row)
 
     def get_rarity(self) -> str:
         '''
         Returns the rarity of the item.
         '''
-        return self.item.get("rarity")
+        return self.__store.get_rarity(self.__row)
 
     def get_value(self) -> int:
         '''
         Returns the value of the item.
         '''
-        return self.item.get("value")
+        return self.__store.get_value(self.__row)
 
     def get_quantity(self) -> int:
         '''
         Returns the quantity of the item.
         '''
-        return self.item.get("quantity")
+        return self.__store.get_quantity(self.__row)
 
     def copy_item(self) -> None:
         '''
@@ -82,7 +196,7 @@ class Item:
         rarity = self.get_rarity()
         value = self.get_value()
 
-        new_item = Item(name, type, rarity, value, 1)
+        new_item = Item(name, type, rarity, value, 1, self.__store)
         return new_item
 
 
@@ -93,8 +207,18 @@ class Player:
     def __init__(self, name: str) -> int:
         self.__name = name
         self.__inventory = {
-            "items": []
+            "items": [],
+            "by_name": {},
+            "by_type": {},
+            "by_rarity": {}
         }
+        self.__item_count = 0
+        self.__inventory_value = 0
+        self.__categories = {}
+        self.__order = {}
+        self.__next_order = 0
+        self.__least_heap = []
+        self.__most_heap = []
 
     def get_name(self) -> str:
         '''
@@ -120,42 +244,132 @@ class Player:
         Adds an item to the player's inventory. If the item already exists,
         updates the quantity.
         '''
-        items = self.get_items()
+        inventory = self.get_inventory()
+        name = item.get_name()
+        inventory_item = inventory["by_name"].get(name)
+
+        if inventory_item is not None:
+            previous = inventory_item.get_quantity()
+            new_quantity = item.get_quantity() + previous
+            inventory_item.set_quantity(new_quantity)
+            self.__track_quantity(inventory_item, previous)
+            return
+        self.__order[name] = self.__next_order
+        self.__next_order += 1
+        inventory["items"].append(item)
+        inventory["by_name"][name] = item
+        inventory["by_type"].setdefault(item.get_type(), {})[name] = item
+        inventory["by_rarity"].setdefault(item.get_rarity(), {})[name] = item
+        self.__track_quantity(item, 0)
+
+    def __receive(self, item: Item, quantity: int) -> None:
+        '''
+        Adds `quantity` units of the item to the inventory. The row of the
+        matching inventory item is updated in place, the item is only copied
+        when the player does not hold it yet.
+        '''
+        inventory_item = self.get_item_in_inventory(item.get_name())
+
+        if inventory_item is None:
+            item_copy = item.copy_item()
+            item_copy.set_quantity(quantity)
+            self.add_item(item_copy)
+            return
+        previous = inventory_item.get_quantity()
+        inventory_item.set_quantity(previous + quantity)
+        self.__track_quantity(inventory_item, previous)
+
+    def remove_item(self, item_name: str, quantity: int) -> int:
+        '''
+        Removes the specified quantity of the item with the specified name
+        from the player's inventory and returns the quantity removed.
+        '''
+        item = self.get_item_in_inventory(item_name)
 
-        for inventory_item in items:
-            if inventory_item.get_name() == item.get_name():
-                new_quantity = item.get_quantity()\
-                    + inventory_item.get_quantity()
-                item.set_quantity(new_quantity)
-                return
-        items.append(item)
+        if item is None:
+            return 0
+        previous = item.get_quantity()
+        removed = item.remove_quantity(quantity)
+        self.__track_quantity(item, previous)
+        return removed
 
-    def get_inventory_value(self) -> int:
+    def __track_quantity(self, item: Item, previous: int) -> None:
         '''
-        Returns the total value of all items in the player's inventory.
+        Updates the running totals (per item type too) and the abundance
+        heaps after the quantity of an inventory item changed from
+        `previous`.
+        Heap entries are invalidated lazily: an entry is only trusted when
+        its quantity still matches the item's current quantity.
         '''
-        items = self.get_items()
-        total_value = 0
+        quantity = item.get_quantity()
+        delta = quantity - previous
+        self.__item_count += delta
+        self.__inventory_value += delta * item.get_value()
+        type = item.get_type()
+        self.__categories[type] = self.__categories.get(type, 0) + delta
 
-        for item in items:
-            value = item.get_value()
-            quantity = item.get_quantity()
-            total_value += value * quantity
+        order = self.__order[item.get_name()]
+        heapq.heappush(self.__least_heap, (quantity, order, item))
+        heapq.heappush(self.__most_heap, (-quantity, order, item))
 
-        return total_value
+        if len(self.__least_heap) > 2 * len(self.__order) + 16:
+            self.__rebuild_heaps()
 
-    def get_item_count(self) -> int:
+    def __rebuild_heaps(self) -> None:
         '''
-        Returns the total number of items in the player's inventory.
+        Rebuilds the abundance heaps from the inventory, dropping stale
+        entries.
         '''
         items = self.get_items()
-        item_count = 0
+        orders = [self.__order[item.get_name()] for item in items]
+        self.__least_heap = [(item.get_quantity(), order, item)
+                             for order, item in zip(orders, items)]
+        self.__most_heap = [(-item.get_quantity(), order, item)
+                            for order, item in zip(orders, items)]
+        heapq.heapify(self.__least_heap)
+        heapq.heapify(self.__most_heap)
 
-        for item in items:
-            quantity = item.get_quantity()
-            item_count += quantity
+    def __heap_top(self, heap: list, sign: int) -> Item | None:
+        '''
+        Pops the stale entries of an abundance heap and returns the item on
+        top of it, or None if the heap is empty.
+        '''
+        by_name = self.get_inventory()["by_name"]
+
+        while heap:
+            quantity, order, item = heap[0]
+            if sign * quantity == item.get_quantity()\
+                    and by_name.get(item.get_name()) is item:
+                return item
+            heapq.heappop(heap)
+        return None
+
+    def __discard_last_item(self, item_name: str) -> None:
+        '''
+        Removes the last added item from the inventory and its indexes.
+        Only used to roll back a batch of transfers, so the item is always
+        the last one of the items list and its quantity is 0. Its heap
+        entries become stale, and as orders are never reused they cannot tie
+        with the entries of a later item.
+        '''
+        inventory = self.get_inventory()
+        item = inventory["by_name"].pop(item_name)
+        inventory["items"].pop()
+        del inventory["by_type"][item.get_type()][item_name]
+        del inventory["by_rarity"][item.get_rarity()][item_name]
+        del self.__order[item_name]
+
+    def get_inventory_value(self) -> int:
+        '''
+        Returns the total value of all items in the player's inventory.
+        '''
+        return self.__inventory_value
 
-        return item_count
+    def get_item_count(self) -> int:
+        '''
+        Returns the total number of items in the player's inventory.
+        '''
+        return self.__item_count
 
     @staticmethod
     def print_item(item: Item) -> None:
@@ -182,18 +396,13 @@ class Player:
         items = self.get_items()
         item_count = 0
 
-        categories = {}
+        categories = self.get_categories()
         categories_keys = categories.keys()
 
         for item in items:
             quantity = item.get_quantity()
             item_count += quantity
 
-            type = item.get_type()
-            type_count = categories.get(type, 0)
-            type_count += quantity
-            categories.update({type: type_count})
-
             self.print_item(item)
 
         inventory_value = self.get_inventory_value()
@@ -211,13 +420,9 @@ class Player:
         Returns the item with the specified name from the player's inventory.
         If the item is not found, returns None.
         '''
-        items = self.get_items()
+        inventory = self.get_inventory()
 
-        for item in items:
-            item_name = item.get_name()
-            if item_name == name:
-                return item
-        return None
+        return inventory["by_name"].get(name)
 
     def give(self, player: 'Player', item_name: str, quantity: int) -> None:
         '''
@@ -230,51 +435,109 @@ class Player:
  {quantity} {item_name} ===")
 
         if item is not None:
-            quantity = item.remove_quantity(quantity)
-            item_copy = item.copy_item()
-            item_copy.set_quantity(quantity)
-            player.add_item(item_copy)
+            quantity = self.remove_item(item_name, quantity)
+            player.__receive(item, quantity)
             print("Transaction successful!")
         else:
             print("Transaction failed.")
 
+    @staticmethod
+    def give_batch(transfers: list[tuple['Player', 'Player', str, int]]
+                   ) -> list[int]:
+        '''
+        Applies a batch of (giver, receiver, item name, quantity) transfers
+        atomically and returns the quantity moved by each transfer.
+        The whole batch is validated first (item held, quantity positive and
+        available, items received earlier in the batch included): if one
+        transfer is invalid an Exception is raised and nothing is applied.
+        If applying fails anyway, the transfers already applied are rolled
+        back before the error is raised again.
+        '''
+        available = {}
+
+        for i, (giver, receiver, item_name, quantity) in enumerate(transfers):
+            key = (id(giver), item_name)
+            if key not in available:
+                item = giver.get_item_in_inventory(item_name)
+                available[key] = 0 if item is None else item.get_quantity()
+            if quantity <= 0 or available[key] < quantity:
+                raise Exception(f"Transfer {i} failed: {giver.get_name()}\
+ cannot give {quantity} {item_name}")
+            receiver_key = (id(receiver), item_name)
+            if receiver_key not in available:
+                item = receiver.get_item_in_inventory(item_name)
+                available[receiver_key] = 0 if item is None\
+                    else item.get_quantity()
+            available[key] -= quantity
+            available[receiver_key] += quantity
+
+        applied = []
+
+        try:
+            for giver, receiver, item_name, quantity in transfers:
+                new_item = receiver.get_item_in_inventory(item_name) is None
+                item = giver.get_item_in_inventory(item_name)
+                giver.remove_item(item_name, quantity)
+                applied.append((giver, None, item_name, quantity, new_item))
+                receiver.__receive(item, quantity)
+                applied[-1] = (giver, receiver, item_name, quantity, new_item)
+        except Exception:
+            for giver, receiver, item_name, quantity, new_item\
+                    in reversed(applied):
+                item = giver.get_item_in_inventory(item_name)
+                if receiver is not None:
+                    receiver.remove_item(item_name, quantity)
+                    if new_item:
+                        receiver.__discard_last_item(item_name)
+                giver.__receive(item, quantity)
+            raise
+
+        return [transfer[3] for transfer in applied]
+
     def get_items_name_by_rarity(self, rarity: str) -> list[Item]:
         '''
         Returns a list of items in the player's inventory that match
         the specified rarity.
         '''
-        items = self.get_items()
+        inventory = self.get_inventory()
 
-        matched_items = []
+        return list(inventory["by_rarity"].get(rarity, {}))
 
-        for item in items:
-            item_rarity = item.get_rarity()
-            if item_rarity == rarity:
-                item_name = item.get_name()
-                matched_items.append(item_name)
+    def get_items_by_type(self, type: str) -> list[Item]:
+        '''
+        Returns a list of items in the player's inventory that match
+        the specified type.
+        '''
+        inventory = self.get_inventory()
 
-        return matched_items
+        return list(inventory["by_type"].get(type, {}).values())
 
-    def get_least_abundant_item(self) -> tuple[str, int]:
-        items = self.get_items()
+    def get_categories(self) -> dict[str, int]:
+        '''
+        Returns the quantity of items held for each item type.
+        '''
+        return dict(self.__categories)
 
-        searched_item = None
+    def get_least_abundant_item(self) -> tuple[str, int] | None:
+        '''
+        Returns the name and quantity of the least abundant item (the first
+        one added on ties), or None if the inventory is empty.
+        '''
+        searched_item = self.__heap_top(self.__least_heap, 1)
 
-        for item in items:
-            if searched_item is None\
-                    or searched_item.get_quantity() > item.get_quantity():
-                searched_item = item
+        if searched_item is None:
+            return None
         return (searched_item.get_name(), searched_item.get_quantity())
 
-    def get_most_abundant_item(self) -> tuple[str, int]:
-        items = self.get_items()
-
-        searched_item = None
+    def get_most_abundant_item(self) -> tuple[str, int] | None:
+        '''
+        Returns the name and quantity of the most abundant item (the first
+        one added on ties), or None if the inventory is empty.
+        '''
+        searched_item = self.__heap_top(self.__most_heap, -1)
 
-        for item in items:
-            if searched_item is None\
-                    or searched_item.get_quantity() < item.get_quantity():
-                searched_item = item
+        if searched_item is None:
+            return None
         return (searched_item.get_name(), searched_item.get_quantity())
 
 
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+from time import perf_counter
+
+from ft_data_stream import fibonacci, fibonacci_term, fibonacci_range
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                             "..", "..", "10", "ex3"))
+from functools_artifacts import memoized_fibonacci  # noqa: E402
+
+
+def linear_term(n: int) -> int:
+    '''
+    Returns F(n) by running the fibonacci generator n + 1 times.
+    '''
+    term = 0
+    for term in fibonacci(n + 1):
+        pass
+    return term
+
+
+def timed(function, *args) -> tuple[float, int]:
+    '''
+    Returns the time taken by function(*args) and its result.
+    '''
+    start = perf_counter()
+    result = function(*args)
+    return (perf_counter() - start, result)
+
+
+def bench_fibonacci(n_max: int) -> None:
+    '''
+    Compares the Fibonacci variants for n = 10, 100, ... up to n_max.
+    '''
+    modulo = 10 ** 9 + 7
+    n = 10
+
+    print(f"=== Fibonacci benchmark (up to n = {n_max}) ===")
+    while n <= n_max:
+        linear, expected = timed(linear_term, n)
+        doubling, term = timed(fibonacci_term, n)
+        assert term == expected
+        memoized_fibonacci.cache_clear()
+        memoized, term = timed(memoized_fibonacci, n)
+        assert term == expected
+        modular, term = timed(fibonacci_term, n, modulo)
+        assert term == expected % modulo
+        streamed, count = timed(lambda: sum(1 for _ in fibonacci_range(
+            n, n + 1000, modulo)))
+        print(f"n = {n:>8}: generator {linear:.6f}s,", end=" ")
+        print(f"fast doubling {doubling:.6f}s,", end=" ")
+        print(f"memoized {memoized:.6f}s,", end=" ")
+        print(f"modular {modular:.6f}s,", end=" ")
+        print(f"modular range of {count} from n {streamed:.6f}s")
+        n *= 10
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        bench_fibonacci(int(sys.argv[1]))
+    else:
+        bench_fibonacci(10 ** 6)
@@ -1,12 +1,35 @@
 #!/usr/bin/env python3
 
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import cycle, islice
+
+
+PLAYERS = ["Bob", "Alice", "Charlie"]
+LEVELS = [1, 5, 8, 12]
+ACTIONS = ["killed monster", "found treasure", "leveled up", "died"]
+
+
+def game_event(i: int) -> tuple[int, str, int, str]:
+    '''
+    Returns the game event of index i (an event only depends on i).
+    '''
+    return (
+        i,
+        PLAYERS[i % len(PLAYERS)],
+        LEVELS[i % len(LEVELS)],
+        ACTIONS[i % len(ACTIONS)],
+    )
+
+
 def game_event_generator(n: int) -> tuple[int, str, int, str]:
     '''
     Generate n game events.
     '''
-    players = ["Bob", "Alice", "Charlie"]
-    levels = [1, 5, 8, 12]
-    actions = ["killed monster", "found treasure", "leveled up", "died"]
+    players = PLAYERS
+    levels = LEVELS
+    actions = ACTIONS
 
     n_player = len(players)
     n_level = len(levels)
@@ -21,6 +44,69 @@ def game_event_generator(n: int) -> tuple[int, str, int, str]:
         )
 
 
+def cyclic_column(values: list, start: int, size: int) -> list:
+    '''
+    Returns the size values of the cyclic column values from index start.
+    '''
+    offset = start % len(values)
+    return list(islice(cycle(values), offset, offset + size))
+
+
+def game_event_chunks(start: int, stop: int,
+                      chunk_size: int = 65536) -> tuple:
+    '''
+    Generates the game events from index start to stop (excluded) as
+    columnar chunks (ids, players, levels, actions) of at most chunk_size
+    events. Starting at any offset is O(1).
+    '''
+    for chunk_start in range(start, stop, chunk_size):
+        chunk_stop = min(chunk_start + chunk_size, stop)
+        size = chunk_stop - chunk_start
+        yield (
+            range(chunk_start, chunk_stop),
+            cyclic_column(PLAYERS, chunk_start, size),
+            array("q", cyclic_column(LEVELS, chunk_start, size)),
+            cyclic_column(ACTIONS, chunk_start, size),
+        )
+
+
+def game_event_stats(start: int, stop: int,
+                     chunk_size: int = 65536) -> dict[str, int]:
+    '''
+    Returns the analytics of the game events from index start to stop
+    (excluded), computed chunk by chunk.
+    '''
+    stats = {"events": 0, "high_level": 0, "treasure": 0, "level_up": 0}
+
+    for ids, players, levels, actions in game_event_chunks(start, stop,
+                                                           chunk_size):
+        stats["events"] += len(ids)
+        stats["high_level"] += sum(level > 10 for level in levels)
+        stats["treasure"] += actions.count("found treasure")
+        stats["level_up"] += actions.count("leveled up")
+    return stats
+
+
+def parallel_game_event_stats(n: int, workers: int | None = None,
+                              chunk_size: int = 65536) -> dict[str, int]:
+    '''
+    Returns the analytics of the first n game events, the range being
+    split in one partition per worker process (one per CPU by default).
+    '''
+    if workers is None:
+        workers = os.cpu_count() or 1
+    bounds = [n * i // workers for i in range(workers + 1)]
+    stats = {"events": 0, "high_level": 0, "treasure": 0, "level_up": 0}
+
+    with ProcessPoolExecutor(workers) as executor:
+        partials = executor.map(game_event_stats, bounds[:-1], bounds[1:],
+                                [chunk_size] * workers)
+        for partial in partials:
+            for key in stats:
+                stats[key] += partial[key]
+    return stats
+
+
 def fibonacci(n: int) -> int:
     '''
     Generates the first n Fibonacci numbers.
@@ -33,6 +119,52 @@ def fibonacci(n: int) -> int:
         a, b = b, b + a
 
 
+def fibonacci_pair(n: int, modulo: int | None = None) -> tuple[int, int]:
+    '''
+    Returns (F(n), F(n + 1)) with fast doubling in O(log n) steps,
+    reduced modulo modulo if given:
+    F(2k) = F(k) * (2 * F(k + 1) - F(k)), F(2k + 1) = F(k)^2 + F(k + 1)^2
+    '''
+    a = 0
+    b = 1
+
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        if bit == "1":
+            a, b = d, c + d
+        else:
+            a, b = c, d
+        if modulo is not None:
+            a %= modulo
+            b %= modulo
+    return (a, b)
+
+
+def fibonacci_term(n: int, modulo: int | None = None) -> int:
+    '''
+    Returns the n-th Fibonacci number (F(0) = 0), modulo modulo if given.
+    '''
+    return fibonacci_pair(n, modulo)[0]
+
+
+def fibonacci_range(start: int, stop: int,
+                    modulo: int | None = None) -> int:
+    '''
+    Generates the Fibonacci numbers F(start) to F(stop - 1) (modulo modulo
+    if given), seeking to start with fast doubling and keeping only two
+    terms in memory.
+    '''
+    a, b = fibonacci_pair(start, modulo)
+
+    for _ in range(start, stop):
+        yield a
+        if modulo is None:
+            a, b = b, a + b
+        else:
+            a, b = b, (a + b) % modulo
+
+
 def prime_number(n: int) -> int:
     '''
     Generates the first n prime numbers.
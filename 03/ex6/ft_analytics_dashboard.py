@@ -1,17 +1,130 @@
 #!/usr/bin/env python3
 
+from array import array
+
+
+class ItemStore:
+    '''
+    Stores items in columns: names in a list, types and rarities interned
+    once and kept as integer codes, values and quantities in typed arrays.
+    An Item is a view over one row, the row is freed when the Item is
+    dropped and reused by the next add_row.
+    '''
+    def __init__(self) -> None:
+        self.__names = []
+        self.__strings = []
+        self.__codes = {}
+        self.__types = array("l")
+        self.__rarities = array("l")
+        self.__values = array("q")
+        self.__quantities = array("q")
+        self.__free = []
+
+    def __len__(self) -> int:
+        return (len(self.__names) - len(self.__free))
+
+    def __intern(self, string: str) -> int:
+        '''
+        Returns the code of the string, registering it on first use.
+        '''
+        code = self.__codes.get(string)
+        if code is None:
+            code = len(self.__strings)
+            self.__codes[string] = code
+            self.__strings.append(string)
+        return (code)
+
+    def add_row(self,
+                name: str,
+                type: str,
+                rarity: str,
+                value: int,
+                quantity: int) -> int:
+        '''
+        Adds an item row to the store and returns its index. A freed row is
+        reused if there is one. The values are checked before any column is
+        changed, so a bad row leaves the store untouched.
+        '''
+        value, quantity = array("q", (value, quantity))
+        type_code = self.__intern(type)
+        rarity_code = self.__intern(rarity)
+
+        if self.__free:
+            row = self.__free.pop()
+            self.__names[row] = name
+            self.__types[row] = type_code
+            self.__rarities[row] = rarity_code
+            self.__values[row] = value
+            self.__quantities[row] = quantity
+            return (row)
+        self.__names.append(name)
+        self.__types.append(type_code)
+        self.__rarities.append(rarity_code)
+        self.__values.append(value)
+        self.__quantities.append(quantity)
+        return (len(self.__names) - 1)
+
+    def free_row(self, row: int) -> None:
+        '''
+        Marks a row as dead so that add_row can reuse it.
+        '''
+        self.__names[row] = None
+        self.__free.append(row)
+
+    def get_name(self, row: int) -> str:
+        return (self.__names[row])
+
+    def get_type(self, row: int) -> str:
+        return (self.__strings[self.__types[row]])
+
+    def get_rarity(self, row: int) -> str:
+        return (self.__strings[self.__rarities[row]])
+
+    def get_value(self, row: int) -> int:
+        return (self.__values[row])
+
+    def get_quantity(self, row: int) -> int:
+        return (self.__quantities[row])
+
+    def set_quantity(self, row: int, quantity: int) -> None:
+        self.__quantities[row] = quantity
+
+
 class Item:
     '''
     Represents an item with a name, type, rarity, value, and quantity.
+    The item is a thin view over a row of an ItemStore (the shared
+    Item.store by default), the row is freed when the item is dropped.
     '''
+    __slots__ = ("__store", "__row")
+
+    store = ItemStore()
+
     def __init__(self,
                  name: str,
                  type: str,
                  rarity: str,
                  value: int,
-                 quantity: int) -> None:
-        self.item = dict(name=name, type=type, rarity=rarity, value=value,
-                         quantity=quantity)
+                 quantity: int,
+                 store: ItemStore | None = None) -> None:
+        self.__row = None
+        if store is None:
+            store = Item.store
+        self.__store = store
+        self.__row = store.add_row(name, type, rarity, value, quantity)
+
+    def __del__(self) -> None:
+        if self.__row is not None:
+            self.__store.free_row(self.__row)
+
+    @property
+    def item(self) -> dict:
+        '''
+        Returns the item as a dict (built on demand from the store row).
+        '''
+        return (dict(name=self.get_name(), type=self.get_type(),
+                     rarity=self.get_rarity(), value=self.get_value(),
+                     quantity=self.get_quantity()))
 
     def set_quantity(self, quantity: int) -> None:
         '''
@@ -19,7 +132,7 @@ class Item:
         '''
         if quantity < 0:
             quantity = 0
-        self.item.update({"quantity": quantity})
+        self.__store.set_quantity(self.__row, quantity)
 
     def add_quantity(self, quantity: int) -> int:
         '''
@@ -47,31 +160,31 @@ class Item:
         '''
         Returns the name of the item.
         '''
-        return (self.item.get("name"))
+        return (self.__store.get_name(self.__row))
 
     def get_type(self) -> str:
         '''
         Returns the type of the item.
         '''
-        return (self.item.get("type"))
+        return (self.__store.get_type(self.__row))
 
     def get_rarity(self) -> str:
         '''
         Returns the rarity of the item.
         '''
-        return (self.item.get("rarity"))
+        return (self.__store.get_rarity(self.__row))
 
     def get_value(self) -> int:
         '''
         Returns the value of the item.
         '''
-        return (self.item.get("value"))
+        return (self.__store.get_value(self.__row))
 
     def get_quantity(self) -> int:
         '''
         Returns the quantity of the item.
         '''
-        return (self.item.get("quantity"))
+        return (self.__store.get_quantity(self.__row))
 
     def copy_item(self) -> "Item":
         '''
@@ -82,14 +195,59 @@ class Item:
         rarity = self.get_rarity()
         value = self.get_value()
 
-        new_item = Item(name, type, rarity, value, 1)
+        new_item = Item(name, type, rarity, value, 1, self.__store)
         return new_item
 
 
+class AchievementRegistry:
+    '''
+    Interns each achievement string to a small integer, so a set of
+    achievements can be stored as an int bitmask.
+    '''
+    def __init__(self) -> None:
+        self.__bits: dict[str, int] = {}
+        self.__names: list[str] = []
+
+    def intern(self, achievement: str) -> int:
+        '''
+        Returns the bit of the achievement, registering it on first use.
+        '''
+        bit = self.__bits.get(achievement)
+        if bit is None:
+            bit = len(self.__names)
+            self.__bits[achievement] = bit
+            self.__names.append(achievement)
+        return (bit)
+
+    def encode(self, achievements) -> int:
+        '''
+        Returns the bitmask of an iterable of achievements.
+        '''
+        mask = 0
+        for achievement in achievements:
+            mask |= 1 << self.intern(achievement)
+        return (mask)
+
+    def decode(self, mask: int) -> set[str]:
+        '''
+        Returns the set of achievements of a bitmask.
+        '''
+        achievements = set()
+        while mask:
+            low = mask & -mask
+            achievements.add(self.__names[low.bit_length() - 1])
+            mask ^= low
+        return (achievements)
+
+
 class Player:
     '''
     Represents a player with a name and an inventory of items.
+    Achievements are stored as a bitmask over the shared
+    Player.registry.
     '''
+    registry = AchievementRegistry()
+
     def __init__(self,
                  name: str,
                  score: int = 0,
@@ -99,7 +257,7 @@ class Player:
             "items": []
         }
         self.__score = score
-        self.__achievements = set(achievements)
+        self.__achievements = Player.registry.encode(achievements)
 
     def get_name(self) -> str:
         '''
@@ -126,6 +284,15 @@ class Player:
         self.__score = score
 
     def get_achievements(self) -> set[str]:
+        '''
+            return the set of the player achievements
+        '''
+        return (Player.registry.decode(self.__achievements))
+
+    def get_achievements_mask(self) -> int:
+        '''
+            return the player achievements as a bitmask
+        '''
         return (self.__achievements)
 
     def get_items(self) -> list[Item]:
@@ -147,7 +314,7 @@ class Player:
             if inventory_item.get_name() == item.get_name():
                 new_quantity = item.get_quantity() + \
                     inventory_item.get_quantity()
-                item.set_quantity(new_quantity)
+                inventory_item.set_quantity(new_quantity)
                 return
 
         items.append(item)
@@ -249,10 +416,10 @@ class Player:
             print("Transaction failed.")
 
     def add_achievement(self, achievement: str) -> None:
-        achievements = self.get_achievements()
-
-        if achievement not in achievements:
-            achievements.add(achievement)
+        '''
+            add an achievement to the player
+        '''
+        self.__achievements |= 1 << Player.registry.intern(achievement)
 
     def print_achievements(self) -> None:
         '''
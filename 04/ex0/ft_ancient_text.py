@@ -1,16 +1,96 @@
 #!/usr/bin/env python3
 
+import mmap
+import os
+import sys
+
+CHUNK_SIZE = 1 << 20
+
+
+def read_chunks(file, chunk_size: int = CHUNK_SIZE):
+    '''
+    Yields the content of a binary file as memoryview slices of one reused
+    buffer of chunk_size bytes. A slice is only valid until the next one.
+    '''
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+
+    while True:
+        size = file.readinto(buffer)
+        if not size:
+            break
+        chunk = view[:size]
+        try:
+            yield chunk
+        finally:
+            chunk.release()
+
+
+def read_mapped(file, chunk_size: int = CHUNK_SIZE):
+    '''
+    Yields the content of a binary file as memoryview slices of a memory
+    mapping of the file, chunk_size bytes at a time. A slice is only valid
+    until the next one.
+    '''
+    if os.fstat(file.fileno()).st_size == 0:
+        return
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            for start in range(0, len(view), chunk_size):
+                chunk = view[start:start + chunk_size]
+                try:
+                    yield chunk
+                finally:
+                    chunk.release()
+
+
+def write_archive(file, mapped: bool = True,
+                  chunk_size: int = CHUNK_SIZE) -> int:
+    '''
+    Writes the content of a file opened in binary mode to stdout without
+    loading it in memory (memory mapped, or read by chunks) and returns the
+    number of bytes written. The bytes are written as they are, without
+    newline or encoding translation.
+    '''
+    sys.stdout.flush()
+    out = getattr(sys.stdout, "buffer", None)
+    written = 0
+
+    if mapped:
+        chunks = read_mapped(file, chunk_size)
+    else:
+        chunks = read_chunks(file, chunk_size)
+    for chunk in chunks:
+        if out is not None:
+            out.write(chunk)
+        else:
+            sys.stdout.write(bytes(chunk).decode(errors="replace"))
+        written += len(chunk)
+    if out is not None:
+        out.flush()
+    return written
+
+
+def read_lines(file_name: str, chunk_size: int = CHUNK_SIZE):
+    '''
+    Yields the lines of file_name one by one, through a chunk_size read
+    buffer.
+    '''
+    with open(file_name, 'r', buffering=chunk_size) as file:
+        yield from file
+
+
 def ft_ancient_text() -> None:
     file_name = "ancient_fragment.txt"
 
     print("=== CYBER ARCHIVES - DATA RECOVERY SYSTEM ===\n")
     print(f"Accessing Storage Vault: {file_name}")
     try:
-        with open(file_name, 'r') as file:
+        with open(file_name, 'rb') as file:
             print("Connection established...\n")
             print("RECOVERED DATA:")
-            content = file.read()
-            print(content)
+            write_archive(file)
+            print()
         print("\nData recovery complete.", end=" ")
     except (FileNotFoundError, PermissionError):
         print("ERROR: Storage vault not found. Run data generator first.\n")
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+from time import perf_counter
+
+from ft_archive_creation import ArchiveWriter
+
+
+def bench_archive_creation(n: int) -> None:
+    '''
+    Appends n entries to an archive, reopening the file for every entry
+    then through an ArchiveWriter, and displays the entries per second.
+    '''
+    file_name = "bench_archive.txt"
+    entry = "[ENTRY] New quantum algorithm discovered"
+
+    print(f"=== Archive writer benchmark ({n} entries) ===")
+    start = perf_counter()
+    for _ in range(n // 10):
+        with open(file_name, 'a') as file:
+            file.write(entry + "\n")
+    reopen = perf_counter() - start
+    print(f"Reopen per entry: {n // 10 / reopen:.0f} entries/s")
+
+    for fsync in ArchiveWriter.FSYNC_POLICIES:
+        start = perf_counter()
+        with ArchiveWriter(file_name, fsync=fsync) as archive:
+            for _ in range(n):
+                archive.write_entry(entry)
+        writer = perf_counter() - start
+        print(f"ArchiveWriter (fsync {fsync}): {n / writer:.0f} entries/s")
+    os.remove(file_name)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        bench_archive_creation(int(sys.argv[1]))
+    else:
+        bench_archive_creation(1000000)
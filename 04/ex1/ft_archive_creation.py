@@ -1,21 +1,97 @@
 #!/usr/bin/env python3
 
+import os
+import time
+
+
+class ArchiveWriter:
+    '''
+    Appends entries to an archive file kept open, collecting them in a
+    buffer flushed once buffer_size characters or flush_interval seconds
+    are reached. fsync is the durability policy: "never", "flush" (after
+    every flush) or "close" (once, when the writer is closed).
+    '''
+    FSYNC_POLICIES = ("never", "flush", "close")
+
+    def __init__(self, file_name: str, buffer_size: int = 1 << 16,
+                 flush_interval: float = 1.0, fsync: str = "never") -> None:
+        if fsync not in self.FSYNC_POLICIES:
+            raise ValueError(f"Unknown fsync policy: {fsync}")
+        self.__file = open(file_name, 'a')
+        self.__buffer: list[str] = []
+        self.__buffered = 0
+        self.__buffer_size = buffer_size
+        self.__flush_interval = flush_interval
+        self.__fsync = fsync
+        self.__last_flush = time.monotonic()
+
+    def __enter__(self) -> 'ArchiveWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def write_entry(self, entry: str) -> None:
+        '''
+        Adds one entry (a line) to the archive.
+        '''
+        self.__buffer.append(entry + "\n")
+        self.__buffered += len(entry) + 1
+        if self.__buffered >= self.__buffer_size\
+                or time.monotonic() - self.__last_flush\
+                >= self.__flush_interval:
+            self.flush()
+
+    def write_entries(self, entries) -> None:
+        '''
+        Adds every entry of an iterable to the archive.
+        '''
+        for entry in entries:
+            self.write_entry(entry)
+
+    def flush(self) -> None:
+        '''
+        Writes the buffered entries to the archive file.
+        '''
+        if self.__buffer:
+            self.__file.write("".join(self.__buffer))
+            self.__buffer.clear()
+            self.__buffered = 0
+        self.__file.flush()
+        if self.__fsync == "flush":
+            os.fsync(self.__file.fileno())
+        self.__last_flush = time.monotonic()
+
+    def close(self) -> None:
+        '''
+        Flushes the buffered entries and closes the archive file.
+        '''
+        if self.__file.closed:
+            return
+        try:
+            self.flush()
+            if self.__fsync == "close":
+                os.fsync(self.__file.fileno())
+        finally:
+            self.__file.close()
+
+
 def ft_archive_creation():
     file_name = "new_discovery.txt"
 
     print("=== CYBER ARCHIVES - DATA PRESERVATION SYSTEM ===\n")
     print(f"Initializing new storage unit: {file_name}")
     try:
-        with open(file_name, 'a') as file:
+        with ArchiveWriter(file_name, fsync="close") as archive:
             print("Storage unit created successfully...\n")
             print("Inscribing preservation data...")
-            content = (
-                "[ENTRY 001] New quantum algorithm discovered\n" +
-                "[ENTRY 002] Efficiency increased by 347%\n" +
-                "[ENTRY 003] Archived by Data Archivist trainee\n"
-                )
-            file.write(content)
-            print(content)
+            entries = [
+                "[ENTRY 001] New quantum algorithm discovered",
+                "[ENTRY 002] Efficiency increased by 347%",
+                "[ENTRY 003] Archived by Data Archivist trainee"
+                ]
+            archive.write_entries(entries)
+            print("\n".join(entries) + "\n")
         print("Data inscription complete. Storage unit sealed.")
         print("Archive 'new_discovery.txt' ready for long-term preservation.")
     except PermissionError as e:
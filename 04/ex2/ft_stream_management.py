@@ -1,8 +1,115 @@
 #!/usr/bin/env python3
 
+import io
 import sys
 
 
+class StreamChannels:
+    '''
+    Buffered layer over the three standard streams: stdin is read in bulk
+    through its own reader of buffer_size bytes, [STANDARD] and [ALERT]
+    lines are collected and written
+    to stdout and stderr in batches of buffer_size characters. In
+    interactive mode (stdin is a terminal by default) prompts are shown
+    and every line is flushed at once; in pipe mode prompts are skipped
+    and lines are only flushed by batch or on close.
+    The channels own stdin until EOF: sys.stdin must not be read before
+    they are created (what it read ahead would be skipped) nor after they
+    are closed (what they read ahead is dropped).
+    '''
+    def __init__(self, buffer_size: int = 1 << 16,
+                 interactive: bool | None = None) -> None:
+        try:
+            self.__stdin = io.TextIOWrapper(
+                open(sys.stdin.fileno(), 'rb', buffering=buffer_size,
+                     closefd=False),
+                encoding=sys.stdin.encoding, errors=sys.stdin.errors)
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            self.__stdin = sys.stdin
+        if interactive is None:
+            interactive = self.__stdin.isatty()
+        self.__interactive = interactive
+        self.__buffer_size = buffer_size
+        self.__pending = {sys.stdout: [], sys.stderr: []}
+        self.__pending_size = {sys.stdout: 0, sys.stderr: 0}
+
+    def __enter__(self) -> 'StreamChannels':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __write(self, stream, content: str) -> None:
+        '''
+        Queues content for stream and flushes it when the policy says so.
+        '''
+        self.__pending[stream].append(content)
+        self.__pending_size[stream] += len(content)
+        if self.__interactive\
+                or self.__pending_size[stream] >= self.__buffer_size:
+            self.__flush_stream(stream)
+
+    def __flush_stream(self, stream) -> None:
+        '''
+        Writes the queued content of stream in one call.
+        '''
+        if self.__pending[stream]:
+            stream.write("".join(self.__pending[stream]))
+            self.__pending[stream].clear()
+            self.__pending_size[stream] = 0
+        stream.flush()
+
+    def write(self, content: str) -> None:
+        '''
+        Queues raw content for stdout.
+        '''
+        self.__write(sys.stdout, content)
+
+    def standard(self, content: str) -> None:
+        '''
+        Queues a [STANDARD] line for stdout.
+        '''
+        self.__write(sys.stdout, "[STANDARD] " + content + "\n")
+
+    def alert(self, content: str) -> None:
+        '''
+        Queues an [ALERT] line for stderr.
+        '''
+        self.__write(sys.stderr, "[ALERT] " + content + "\n")
+
+    def input(self, demand: str) -> str:
+        '''
+        Reads one line of stdin, showing demand first in interactive mode.
+        '''
+        if self.__interactive:
+            self.__write(sys.stdout, demand)
+        return self.__stdin.readline().replace("\n", "")
+
+    def lines(self):
+        '''
+        Yields the remaining lines of stdin, without their newline.
+        '''
+        for line in self.__stdin:
+            yield line.rstrip("\n")
+
+    def flush(self) -> None:
+        '''
+        Writes everything queued to stdout and stderr.
+        '''
+        self.__flush_stream(sys.stdout)
+        self.__flush_stream(sys.stderr)
+
+    def close(self) -> None:
+        '''
+        Flushes the queued lines and closes the stdin reader. The stdin file
+        descriptor stays open, but what the reader read ahead is dropped.
+        '''
+        self.flush()
+        if self.__stdin is not sys.stdin:
+            self.__stdin.close()
+            self.__stdin = sys.stdin
+
+
 def standard_print(content: str) -> None:
     sys.stdout.write("[STANDARD] " + content + "\n")
 
@@ -33,5 +140,23 @@ def ft_stream_management() -> None:
     print("\nThree-channel communication test successful.")
 
 
+def ft_stream_pipe() -> None:
+    '''
+    Reads "<archivist ID> <status report>" lines from stdin and writes one
+    archive status line per input line, through batched channels.
+    '''
+    with StreamChannels(interactive=False) as channels:
+        for line in channels.lines():
+            archivist_id, _, status_report = line.partition(" ")
+            if status_report:
+                channels.standard(f"Archive status from {archivist_id}: \
+{status_report}")
+            elif archivist_id:
+                channels.alert(f"Missing status report from {archivist_id}")
+
+
 if __name__ == "__main__":
-    ft_stream_management()
+    if len(sys.argv) > 1 and sys.argv[1] == "--pipe":
+        ft_stream_pipe()
+    else:
+        ft_stream_management()
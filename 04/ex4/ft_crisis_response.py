@@ -1,12 +1,86 @@
 #!/usr/bin/env python3
 
+import mmap
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+CHUNK_SIZE = 1 << 20
+
+
+def read_chunks(file, chunk_size: int = CHUNK_SIZE):
+    '''
+    Yields the content of a binary file as memoryview slices of one reused
+    buffer of chunk_size bytes. A slice is only valid until the next one.
+    '''
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+
+    while True:
+        size = file.readinto(buffer)
+        if not size:
+            break
+        chunk = view[:size]
+        try:
+            yield chunk
+        finally:
+            chunk.release()
+
+
+def read_mapped(file, chunk_size: int = CHUNK_SIZE):
+    '''
+    Yields the content of a binary file as memoryview slices of a memory
+    mapping of the file, chunk_size bytes at a time. A slice is only valid
+    until the next one.
+    '''
+    if os.fstat(file.fileno()).st_size == 0:
+        return
+    with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        with memoryview(mapped) as view:
+            for start in range(0, len(view), chunk_size):
+                chunk = view[start:start + chunk_size]
+                try:
+                    yield chunk
+                finally:
+                    chunk.release()
+
+
+def write_archive(file, mapped: bool = True,
+                  chunk_size: int = CHUNK_SIZE) -> int:
+    '''
+    Writes the content of a file opened in binary mode to stdout without
+    loading it in memory (memory mapped, or read by chunks) and returns the
+    number of bytes written. The bytes are written as they are, without
+    newline or encoding translation.
+    '''
+    sys.stdout.flush()
+    out = getattr(sys.stdout, "buffer", None)
+    written = 0
+
+    if mapped:
+        chunks = read_mapped(file, chunk_size)
+    else:
+        chunks = read_chunks(file, chunk_size)
+    for chunk in chunks:
+        if out is not None:
+            out.write(chunk)
+        else:
+            sys.stdout.write(bytes(chunk).decode(errors="replace"))
+        written += len(chunk)
+    if out is not None:
+        out.flush()
+    return written
+
+
 def ft_recover_file(file_name: str) -> None:
     print(f"CRISIS ALERT: Attempting to access to '{file_name}'")
     status = "Normal operations resumed"
     try:
-        with open(file_name, 'r') as file:
-            content = file.read()
-            print(f"SUCCESS: Archive recovered = ''{content}''")
+        with open(file_name, 'rb') as file:
+            print("SUCCESS: Archive recovered = ''", end="")
+            write_archive(file)
+            print("''")
     except FileNotFoundError:
         print("RESPONSE: Archive not found in storage matrix")
         status = "Crisis handled, system stable"
@@ -17,6 +91,54 @@ def ft_recover_file(file_name: str) -> None:
         print(f"STATUS: {status}")
 
 
+def recover_report(file_name: str) -> dict:
+    '''
+    Reads file_name through chunks without printing it and returns its
+    recovery report: status ("success", "not_found", "permission_denied"
+    or "error"), bytes read, latency in seconds and error message.
+    '''
+    report = {"file": file_name, "status": "success", "bytes": 0,
+              "latency": 0.0, "error": None}
+    start = time.perf_counter()
+    try:
+        with open(file_name, 'rb') as file:
+            for chunk in read_chunks(file, 1 << 16):
+                report["bytes"] += len(chunk)
+    except FileNotFoundError as e:
+        report["status"] = "not_found"
+        report["error"] = str(e)
+    except PermissionError as e:
+        report["status"] = "permission_denied"
+        report["error"] = str(e)
+    except OSError as e:
+        report["status"] = "error"
+        report["error"] = str(e)
+    finally:
+        report["latency"] = time.perf_counter() - start
+    return report
+
+
+def recover_files(file_names: list[str], workers: int = 32) -> list[dict]:
+    '''
+    Recovers many files concurrently with a bounded thread pool and
+    returns their recovery reports, in the order of file_names.
+    '''
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(recover_report, file_names))
+
+
+def recovery_summary(reports: list[dict]) -> dict[str, int]:
+    '''
+    Returns the number of files of each recovery status.
+    '''
+    summary = {"success": 0, "not_found": 0, "permission_denied": 0,
+               "error": 0}
+
+    for report in reports:
+        summary[report["status"]] += 1
+    return summary
+
+
 def ft_crisis_response() -> None:
     print("=== CYBER ARCHIVES - CRISIS RESPONSE SYSTEM ===\n")
     ft_recover_file("lost_archive.txt")
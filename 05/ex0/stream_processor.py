@@ -1,10 +1,18 @@
 #!/usr/bin/env python3
 
-from typing import Any, List
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 from abc import ABC, abstractmethod
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+import re
 
 
 class DataProcessor(ABC):
+    # Processors with a narrower validate() have a higher specificity, the
+    # dispatcher tries them before the generic ones.
+    SPECIFICITY: int = 0
+
     @abstractmethod
     def process(self, data: Any) -> str:
         pass
@@ -18,9 +26,10 @@ class DataProcessor(ABC):
             data = f"\"{data}\""
         print(f"Processing data: {data}")
 
-    def print_validation(self, data: bool) -> None:
+    def print_validation(self, data: bool) -> bool:
         result: bool = self.validate(data)
         print(f"Validation: {self.type} data {'un'*(not result)}verified")
+        return result
 
     def print_output(self, data: Any) -> None:
         result: str = self.process(data)
@@ -37,30 +46,76 @@ class DataProcessor(ABC):
 
 
 class NumericProcessor(DataProcessor):
+    SPECIFICITY: int = 1
+    INT_CODES: str = "bBhHiIlLqQ"
+
     def __init__(self):
         self.type = "Numeric"
         print("Initializing Numeric Processor...")
 
-    def process(self, data: Any) -> str:
+    def process(self, data: Any, valid: Optional[bool] = None) -> str:
+        stats: Optional[Dict[str, Union[int, float]]] = \
+            self.analyze(data, valid)
 
-        if self.validate(data):
-            size: int = len(data)
-            total: int = sum(data)
-            avg: float = total / size
+        if stats is not None and stats["count"] > 0:
+            size: int = stats["count"]
+            total: int = stats["sum"]
+            avg: float = stats["mean"]
             return f"Processed {size} numeric values, sum={total}, avg={avg}"
 
         return "ERROR"
 
+    def do_all(self, data: Any) -> str:
+        self.print_processing(data)
+        valid: bool = self.print_validation(data)
+        print(self.format_output(self.process(data, valid)))
+
     def validate(self, data: Any) -> bool:
-        if type(data) is not list:
-            return False
-        for element in data:
-            if type(element) is not int:
-                return False
-        return True
+        if type(data) is list:
+            return set(map(type, data)) <= {int}
+        return self.is_int_buffer(data)
+
+    def is_int_buffer(self, data: Any) -> bool:
+        if isinstance(data, array):
+            return data.typecode in self.INT_CODES
+        if isinstance(data, memoryview):
+            return data.ndim == 1 \
+                and data.format.lstrip("@=<>!") in self.INT_CODES
+        dtype: Any = getattr(data, "dtype", None)
+        return getattr(dtype, "kind", None) in ("i", "u") \
+            and getattr(data, "ndim", None) == 1
+
+    def analyze(
+            self,
+            data: Any,
+            valid: Optional[bool] = None
+    ) -> Optional[Dict[str, Union[int, float]]]:
+        if valid is None:
+            valid = self.validate(data)
+        if not valid:
+            return None
+        count: int = len(data)
+        if count == 0:
+            return {"count": 0, "sum": 0, "mean": None, "min": None,
+                    "max": None}
+        if hasattr(data, "dtype"):
+            data = memoryview(data)
+        total: int = 0
+        low: int = data[0]
+        high: int = low
+        for value in data:
+            total += value
+            if value < low:
+                low = value
+            elif value > high:
+                high = value
+        return {"count": count, "sum": total, "mean": total / count,
+                "min": low, "max": high}
 
 
 class TextProcessor(DataProcessor):
+    WORD: re.Pattern = re.compile(r"\S+")
+
     def __init__(self):
         self.type = "Text"
         print("Initializing Text Processor...")
@@ -69,45 +124,183 @@ class TextProcessor(DataProcessor):
 
         if self.validate(data):
             size: int = len(data)
-            words: List[str] = data.split(" ")
-            word_count = len(words)
+            word_count: int = data.count(" ") + 1
             return f"Processed text: {size} characters, {word_count} words"
 
         return "ERROR"
 
+    def process_stream(
+            self,
+            chunks: Iterable[str],
+            by_spaces: bool = False) -> Dict[str, int]:
+        # Words are runs of non-whitespace by default ("Hello  World" has 2
+        # words). With by_spaces, words are counted like process() does:
+        # the number of single spaces plus one ("Hello  World" has 3).
+        stats: Dict[str, int] = {"characters": 0, "words": 0, "lines": 0}
+        in_word: bool = False
+        last: str = "\n"
+
+        for chunk in chunks:
+            if not chunk:
+                continue
+            stats["characters"] += len(chunk)
+            stats["lines"] += chunk.count("\n")
+            if by_spaces:
+                stats["words"] += chunk.count(" ")
+            else:
+                stats["words"] += self.WORD.subn("", chunk)[1]
+                if in_word and not chunk[0].isspace():
+                    stats["words"] -= 1
+            last = chunk[-1]
+            in_word = not last.isspace()
+
+        if by_spaces:
+            stats["words"] += 1
+        if last != "\n":
+            stats["lines"] += 1
+        return stats
+
+    def process_file(
+            self,
+            file_name: str,
+            chunk_size: int = 1 << 20,
+            by_spaces: bool = False) -> Dict[str, int]:
+        with open(file_name, "r") as file:
+            return self.process_stream(
+                iter(lambda: file.read(chunk_size), ""), by_spaces)
+
     def validate(self, data: Any) -> bool:
         return type(data) is str
 
 
 class LogProcessor(DataProcessor):
-    def __init__(self):
+    SPECIFICITY: int = 1
+    DEFAULT_LEVELS: Dict[str, str] = {"ERROR": "ALERT", "INFO": "INFO"}
+
+    def __init__(self, levels: Optional[Dict[str, str]] = None):
         self.type = "Log"
+        if levels is None:
+            levels = self.DEFAULT_LEVELS
+        if not levels or "" in levels:
+            raise ValueError("Log levels must be non-empty prefixes")
+        self.__headers: Dict[str, str] = {
+            level: f"[{flag}] {level} level detected: "
+            for level, flag in levels.items()
+        }
+        prefixes: List[str] = sorted(levels, key=len, reverse=True)
+        self.__pattern: re.Pattern = re.compile(
+            "|".join(map(re.escape, prefixes)))
         print("Initializing Log Processor...")
 
+    def rewrite(self, data: str) -> Optional[Tuple[str, str]]:
+        match: Optional[re.Match] = self.__pattern.match(data)
+        if match is None:
+            return None
+        level: str = match.group()
+        return level, self.__headers[level] + data[match.end():]
+
     def process(self, data: Any) -> str:
 
-        if self.validate(data):
-            output_log: str | None = None
-            for log_type in [("ERROR", "ALERT"), ("INFO", "INFO")]:
-                log_type, flag = log_type
-                if data.startswith(log_type):
-                    output_log = data.replace(
-                        log_type, f"[{flag}] {log_type} level detected: ",
-                        1
-                        )
-            return f"Processed log: {output_log}"
+        if type(data) is str:
+            rewritten: Optional[Tuple[str, str]] = self.rewrite(data)
+            if rewritten is not None:
+                return f"Processed log: {rewritten[1]}"
 
         return "ERROR"
 
+    def process_batch(
+            self,
+            lines: Iterable[str]) -> Tuple[List[str], Dict[str, int]]:
+        counts: Dict[str, int] = dict.fromkeys(self.__headers, 0)
+        counts["UNKNOWN"] = 0
+        output: List[str] = []
+        match = self.__pattern.match
+        headers: Dict[str, str] = self.__headers
+
+        for line in lines:
+            if type(line) is not str:
+                counts["UNKNOWN"] += 1
+                continue
+            found: Optional[re.Match] = match(line)
+            if found is None:
+                counts["UNKNOWN"] += 1
+                continue
+            level: str = found.group()
+            counts[level] += 1
+            output.append(headers[level] + line[found.end():])
+        return output, counts
+
     def validate(self, data: Any) -> bool:
         if type(data) is not str:
             return False
 
-        for log_type in ["ERROR", "INFO"]:
-            if data.startswith(log_type):
-                return True
-
-        return False
+        return self.__pattern.match(data) is not None
+
+
+DISPATCH_PROCESSORS: List[DataProcessor] = []
+
+
+def init_dispatch_worker(processors: List[DataProcessor]) -> None:
+    DISPATCH_PROCESSORS[:] = processors
+
+
+def run_dispatch_batch(
+        batch: List[Any],
+        processors: Optional[List[DataProcessor]] = None) -> List[str]:
+    # Each item goes to the first processor that validates it, processors
+    # being sorted by decreasing specificity (see ProcessorDispatcher).
+    if processors is None:
+        processors = DISPATCH_PROCESSORS
+    results: List[str] = []
+
+    for data in batch:
+        for processor in processors:
+            if processor.validate(data):
+                results.append(processor.process(data))
+                break
+        else:
+            results.append("ERROR")
+    return results
+
+
+class ProcessorDispatcher:
+    def __init__(
+            self,
+            processors: List[DataProcessor],
+            workers: Optional[int] = None,
+            batch_size: int = 1024) -> None:
+        # Most specific processors first, so a log line reaches the
+        # LogProcessor even if a TextProcessor (any str) is listed before
+        # it. Ties keep the given order.
+        self.__processors: List[DataProcessor] = sorted(
+            processors, key=lambda processor: -processor.SPECIFICITY)
+        self.__workers: Optional[int] = workers
+        self.__batch_size: int = batch_size
+
+    def __batches(self, items: Iterable[Any]) -> Iterable[List[Any]]:
+        iterator = iter(items)
+        while True:
+            batch: List[Any] = list(islice(iterator, self.__batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def dispatch(self, items: Iterable[Any]) -> List[str]:
+        results: List[str] = []
+
+        if self.__workers == 1:
+            for batch in self.__batches(items):
+                results.extend(run_dispatch_batch(batch, self.__processors))
+            return results
+
+        with ProcessPoolExecutor(
+                max_workers=self.__workers,
+                initializer=init_dispatch_worker,
+                initargs=(self.__processors,)) as executor:
+            for batch_results in executor.map(run_dispatch_batch,
+                                              self.__batches(items)):
+                results.extend(batch_results)
+        return results
 
 
 def stream_processor() -> None:
@@ -27,11 +27,19 @@ def partial_enchanter(base_enchantment: callable) -> dict[str, callable]:
     }
 
 
-@functools.lru_cache(maxsize=None)
+@functools.lru_cache(maxsize=256)
 def memoized_fibonacci(n: int) -> int:
-    if n < 2:
-        return n
-    return memoized_fibonacci(n - 1) + memoized_fibonacci(n - 2)
+    # fast doubling: F(2k) = F(k) * (2F(k + 1) - F(k)),
+    # F(2k + 1) = F(k)^2 + F(k + 1)^2, so the recursion is only
+    # O(log n) deep and a small bounded cache is enough
+    if n <= 2:
+        return min(n, 1)
+    k = n // 2
+    a = memoized_fibonacci(k)
+    b = memoized_fibonacci(k + 1)
+    if n % 2 == 0:
+        return a * (2 * b - a)
+    return a * a + b * b
 
 
 def spell_dispatcher() -> callable: